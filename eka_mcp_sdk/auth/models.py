@@ -51,3 +51,14 @@ class EkaAPIError(Exception):
         self.status_code = status_code
         self.error_code = error_code
         super().__init__(self.message)
+    
+    def to_response(self) -> dict:
+        """Standard error result returned by MCP tools for this error."""
+        return {
+            "success": False,
+            "error": {
+                "message": self.message,
+                "status_code": self.status_code,
+                "error_code": self.error_code
+            }
+        }
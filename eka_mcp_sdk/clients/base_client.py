@@ -1,5 +1,7 @@
+import asyncio
 import httpx
-from typing import Dict, Any, Optional
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict, Any, Optional, Tuple
 from abc import ABC, abstractmethod
 import logging
 
@@ -10,17 +12,138 @@ from ..utils.logger_utils import _build_curl_command
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 lets enrichment fan-out multiplex over one connection; it needs the
+# optional h2 package (pip install "eka-mcp-sdk[http2]")
+try:
+    import h2  # noqa: F401
+    HTTP2_ENABLED = True
+except ImportError:
+    HTTP2_ENABLED = False
+
+# orjson decodes response bodies several times faster than the stdlib json
+# used by httpx's Response.json(); optional (pip install "eka-mcp-sdk[fastjson]")
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# Bodies above this size (e.g. long appointment histories) are decoded in a
+# worker thread so other tool calls on the event loop are not stalled by the
+# parse; below it the thread hand-off costs more than the decode itself
+JSON_OFFLOAD_THRESHOLD = 1024 * 1024
+
+HTTP_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=60.0
+)
+
+# Keep the generous overall budget for slow endpoints, but fail fast when the
+# API host is unreachable instead of holding a pooled slot for 30s
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# 429 responses are retried with exponential backoff (0.1s, 0.2s, 0.4s), or
+# after the server's Retry-After when it asks for no more than the cap
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 0.1
+RATE_LIMIT_MAX_DELAY = 2.0
+
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+    
+    Clients built by ClientFactory share this one connection pool, so TCP
+    and TLS sessions are reused across callers instead of every cached
+    client holding its own pool. Cookies are never stored, since the pool
+    is shared between users; auth travels in per-request headers.
+    """
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            http2=HTTP2_ENABLED,
+            limits=HTTP_LIMITS,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+        )
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the process-wide HTTP client (called on server shutdown)."""
+    global _shared_http_client
+    client, _shared_http_client = _shared_http_client, None
+    if client is not None:
+        await client.aclose()
+
+
+async def _decode_json(content: bytes) -> Any:
+    """Decode a JSON response body, off the event loop when it is large."""
+    if len(content) > JSON_OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(_json_loads, content)
+    return _json_loads(content)
+
 
 class BaseEkaClient(ABC):
     """Base client for Eka.care API interactions."""
     
-    def __init__(self, access_token: Optional[str] = None, custom_headers: Optional[Dict[str, str]] = None):
-        self._http_client = httpx.AsyncClient(timeout=30.0)
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        custom_headers: Optional[Dict[str, str]] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
+        # An injected http_client is shared and owned by the caller; otherwise
+        # this client gets (and closes) a private connection pool
+        self._owns_http_client = http_client is None
+        self._http_client = http_client or httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            http2=HTTP2_ENABLED,
+            limits=HTTP_LIMITS
+        )
         self._auth_manager = AuthenticationManager(access_token)
         self._custom_headers = custom_headers or {}
         self.last_curl_command: Optional[str] = None
         self.access_token = access_token
     
+    async def _prepare_headers(self, headers: Dict[str, str]) -> None:
+        """Add client-id, auth and instance custom headers in place."""
+        if not settings.client_id:
+            raise EkaAPIError("EKA_CLIENT_ID environment variable is required but not set")
+
+        headers["client-id"] = settings.client_id
+
+        if self.access_token or settings.client_secret:
+            # Get authentication context
+            auth_context = await self._auth_manager.get_auth_context()
+        
+            # Add auth headers for all apis
+            headers.update(auth_context.auth_headers)
+        
+        # Add instance custom headers
+        if self._custom_headers:
+            headers.update(self._custom_headers)
+    
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, backing off and retrying while the API rate-limits it."""
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            response = await self._http_client.request(method, url, **kwargs)
+            if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                return response
+            delay = RATE_LIMIT_BACKOFF * 2 ** attempt
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+            if delay > RATE_LIMIT_MAX_DELAY:
+                return response
+            logger.warning("Rate limited on %s %s, retrying in %.1fs", method, url, delay)
+            await asyncio.sleep(delay)
+        return response
+    
     async def _make_request(
         self,
         method: str,
@@ -37,47 +160,33 @@ class BaseEkaClient(ABC):
         headers = headers or {}
         
         try:
-            if not settings.client_id:
-                raise EkaAPIError("EKA_CLIENT_ID environment variable is required but not set")
-
-            headers["client-id"] = settings.client_id
-
-            if self.access_token or settings.client_secret:
-                # Get authentication context
-                auth_context = await self._auth_manager.get_auth_context()
-            
-                # Add auth headers for all apis
-                headers.update(auth_context.auth_headers)
-            
-            # Add instance custom headers
-            if self._custom_headers:
-                headers.update(self._custom_headers)
+            await self._prepare_headers(headers)
             
             # Generate curl command for debugging
             curl_cmd = _build_curl_command(method, url, headers, data, params)
             self.last_curl_command = curl_cmd  # Store for test access
             
             # Use standard Python logging
-            logger.debug(f"API Request: {method} {endpoint}")
+            logger.debug("API Request: %s %s", method, endpoint)
             if params:
-                logger.debug(f"Request params: {params}")
-            logger.debug(f"Curl command: {curl_cmd}")
+                logger.debug("Request params: %s", params)
+            logger.debug("Curl command: %s", curl_cmd)
             
             # Make request
-            response = await self._http_client.request(
-                method=method,
-                url=url,
+            response = await self._send(
+                method,
+                url,
                 headers=headers,
                 json=data,
                 params=params
             )
 
             # Log response status
-            logger.debug(f"API Response: {response.status_code}")
+            logger.debug("API Response: %s", response.status_code)
             
             # Handle response
             if response.status_code >= 400:
-                logger.error(f"API error: {response.status_code} - {response.text[:200]}")
+                logger.error("API error: %s - %s", response.status_code, response.text[:200])
                 
                 error_detail = await self._parse_error_response(response)
                 raise EkaAPIError(
@@ -87,14 +196,14 @@ class BaseEkaClient(ABC):
                 )
             
             # Handle 204 No Content or empty responses
-            if response.status_code == 204 or not response.text:
+            if response.status_code == 204 or not response.content:
                 return {"success": True, "status_code": response.status_code}
             
             if headers.get("Accept") == "application/x-protobuf":
                 return response.content
             
             try:
-                response_data = response.json()
+                response_data = await _decode_json(response.content)
             except Exception:
                 # If JSON parsing fails but status is successful, return success
                 if 200 <= response.status_code < 300:
@@ -104,13 +213,76 @@ class BaseEkaClient(ABC):
             return response_data
             
         except httpx.RequestError as e:
-            logger.error(f"Network error for {method} {url}: {str(e)}")
+            logger.error("Network error for %s %s: %s", method, url, e)
             raise EkaAPIError(f"Network error: {str(e)}")
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error for {method} {url}: {e.response.status_code} - {e.response.text}")
+            logger.error("HTTP error for %s %s: %s - %s", method, url, e.response.status_code, e.response.text)
             raise EkaAPIError(f"HTTP error: {e.response.status_code}", e.response.status_code)
         except Exception as e:
-            logger.error(f"Unexpected error for {method} {url}: {str(e)}")
+            logger.error("Unexpected error for %s %s: %s", method, url, e)
+            raise EkaAPIError(f"Unexpected error: {str(e)}")
+    
+    async def get_with_etag(
+        self,
+        endpoint: str,
+        etag: Optional[str] = None,
+        api_base_url: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Optional[Any], Optional[str]]:
+        """
+        Make a conditional GET request.
+        
+        Sends ``If-None-Match`` when an ETag is given and, unlike
+        ``_make_request``, does not treat ``304 Not Modified`` as an error.
+        
+        Args:
+            endpoint: API endpoint path
+            etag: ETag from a previous response, if any
+            api_base_url: Override for the API base URL
+            params: Query parameters
+            
+        Returns:
+            (status_code, parsed JSON body or None on 304, ETag of the response)
+            
+        Raises:
+            EkaAPIError: On network errors or 4xx/5xx responses
+        """
+        api_base = api_base_url or settings.api_base_url
+        url = f"{api_base}{endpoint}"
+        headers: Dict[str, str] = {}
+        
+        try:
+            await self._prepare_headers(headers)
+            if etag:
+                headers["If-None-Match"] = etag
+            
+            logger.debug("API Request: GET %s (If-None-Match: %s)", endpoint, etag)
+            response = await self._send("GET", url, headers=headers, params=params)
+            logger.debug("API Response: %s", response.status_code)
+            
+            if response.status_code == 304:
+                return 304, None, response.headers.get("ETag", etag)
+            
+            if response.status_code >= 400:
+                logger.error("API error: %s - %s", response.status_code, response.text[:200])
+                
+                error_detail = await self._parse_error_response(response)
+                raise EkaAPIError(
+                    message=error_detail["message"],
+                    status_code=response.status_code,
+                    error_code=error_detail.get("error_code")
+                )
+            
+            body = await _decode_json(response.content) if response.content else {}
+            return response.status_code, body, response.headers.get("ETag")
+            
+        except EkaAPIError:
+            raise
+        except httpx.RequestError as e:
+            logger.error("Network error for GET %s: %s", url, e)
+            raise EkaAPIError(f"Network error: {str(e)}")
+        except Exception as e:
+            logger.error("Unexpected error for GET %s: %s", url, e)
             raise EkaAPIError(f"Unexpected error: {str(e)}")
     
     async def _parse_error_response(self, response: httpx.Response) -> Dict[str, Any]:
@@ -130,8 +302,9 @@ class BaseEkaClient(ABC):
             }
     
     async def close(self) -> None:
-        """Close HTTP client connections."""
-        await self._http_client.aclose()
+        """Close HTTP client connections, unless the pool is shared."""
+        if self._owns_http_client:
+            await self._http_client.aclose()
     
     @abstractmethod
     def get_api_module_name(self) -> str:
@@ -86,7 +86,12 @@ class BaseEMRClient(BaseEkaClient):
     
     @abstractmethod
     async def get_business_entities(self) -> Dict[str, Any]:
-        """Get Clinic and Doctor details for the business."""
+        """
+        Get Clinic and Doctor details for the business.
+        
+        Must return the unwrapped common shape with "business", "clinics"
+        and "doctors" keys always present; callers index it directly.
+        """
         pass
     
     @abstractmethod
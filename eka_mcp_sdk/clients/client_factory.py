@@ -4,18 +4,40 @@ EMR Client Factory.
 Creates workspace-specific EMR clients based on workspace ID from request headers.
 """
 
+import inspect
 import logging
-from typing import Optional, Dict
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional, Dict, Tuple
 
+from .base_client import BaseEkaClient, close_shared_http_client, get_shared_http_client
 from .eka_emr_client import EkaEMRClient
 from ..config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _accepts_http_client(client_class: type) -> bool:
+    """Whether client_class's constructor takes the http_client argument."""
+    try:
+        parameters = inspect.signature(client_class).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        parameter.name == "http_client" or parameter.kind is inspect.Parameter.VAR_KEYWORD
+        for parameter in parameters
+    )
+
+
 class ClientFactory:
     """Factory for creating workspace-specific EMR clients."""
     
+    # Shared clients keyed by caller identity, so repeat tool calls reuse one
+    # client and its auth state; all of them share one connection pool
+    CLIENT_CACHE_SIZE = 128
+    _client_cache: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+    
     @classmethod
     def _get_default_client_type(cls) -> str:
         """Get default client type from environment settings."""
@@ -29,7 +51,8 @@ class ClientFactory:
         cls,
         workspace_id: str,
         access_token: Optional[str] = None,
-        custom_headers: Optional[Dict[str, str]] = None
+        custom_headers: Optional[Dict[str, str]] = None,
+        client_class: Optional[type] = None
     ):
         """
         Create an EMR client for the specified workspace.
@@ -38,17 +61,89 @@ class ClientFactory:
             workspace_id: The workspace identifier (e.g., 'moolchand', 'ekaemr')
             access_token: Optional access token for authenticated requests
             custom_headers: Optional custom headers to include in requests
+            client_class: Optional client class overriding the workspace mapping
             
         Returns:
-            An EMR client instance for the workspace
+            An EMR client instance for the workspace, using the shared
+            process-wide connection pool
         """
         workspace_id = workspace_id.lower() if workspace_id else "ekaemr"
         
-        client_class = settings.get_client_class(workspace_id) or EkaEMRClient
+        client_class = client_class or settings.get_client_class(workspace_id) or EkaEMRClient
+        
+        logger.debug("Creating %s for workspace: %s", client_class.__name__, workspace_id)
+        
+        if _accepts_http_client(client_class):
+            return client_class(
+                access_token=access_token,
+                custom_headers=custom_headers,
+                http_client=get_shared_http_client()
+            )
+        
+        # Workspace clients with their own __init__(access_token, custom_headers)
+        # predate http_client; build them as before and move them onto the pool
+        client = client_class(access_token=access_token, custom_headers=custom_headers)
+        if isinstance(client, BaseEkaClient) and client._owns_http_client:
+            client._http_client = get_shared_http_client()
+            client._owns_http_client = False
+        return client
+    
+    @classmethod
+    def get_client(
+        cls,
+        workspace_id: str,
+        access_token: Optional[str] = None,
+        custom_headers: Optional[Dict[str, str]] = None,
+        client_class: Optional[type] = None
+    ):
+        """
+        Get a shared EMR client for the caller, creating it on first use.
+        
+        Clients are cached per (workspace, access token, custom headers,
+        client class) with least-recently-used eviction, so credentials are
+        never shared between callers.
         
-        logger.debug(f"Creating {client_class.__name__} for workspace: {workspace_id}")
+        Args:
+            workspace_id: The workspace identifier (e.g., 'moolchand', 'ekaemr')
+            access_token: Optional access token for authenticated requests
+            custom_headers: Optional custom headers to include in requests
+            client_class: Optional client class overriding the workspace mapping
+                (e.g. AbhaClient, or EkaEMRClient for EMR-only tools)
+            
+        Returns:
+            An EMR client instance for the workspace
+        """
+        custom_headers = custom_headers or {}
+        key = (
+            workspace_id.lower() if workspace_id else "ekaemr",
+            access_token,
+            tuple(sorted(custom_headers.items())),
+            client_class
+        )
         
-        return client_class(access_token=access_token, custom_headers=custom_headers)
+        client = cls._client_cache.get(key)
+        if client is not None:
+            cls._client_cache.move_to_end(key)
+            return client
+        
+        client = cls._client_cache[key] = cls.create_client(
+            workspace_id, access_token, custom_headers, client_class
+        )
+        while len(cls._client_cache) > cls.CLIENT_CACHE_SIZE:
+            cls._client_cache.popitem(last=False)
+        return client
+    
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close every shared client and the pool (called on server shutdown)."""
+        clients = list(cls._client_cache.values())
+        cls._client_cache.clear()
+        for client in clients:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning("Failed to close cached client: %s", e)
+        await close_shared_http_client()
     
     @classmethod
     def get_supported_workspaces(cls) -> list:
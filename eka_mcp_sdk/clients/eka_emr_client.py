@@ -1,9 +1,12 @@
 from eka_mcp_sdk import EkaAPIError
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta, timezone
+import asyncio
+from itertools import islice
 import logging
 
 from .base_emr_client import BaseEMRClient
+from ..utils.async_cache import business_entities_cache, business_entities_validators, caller_identity
 from ..utils.eka_response_parsers import (
     parse_slots_to_common_format,
     parse_available_dates,
@@ -153,6 +156,12 @@ class EkaEMRClient(BaseEMRClient):
         """
         Get business entities in common contract format.
         
+        Results are cached for a short TTL per access token and custom headers.
+        Once that expires the listing is revalidated with its ETag, and the
+        previous parsed result is reused when the API answers 304. The
+        returned dict is that shared cached object and must not be modified;
+        DoctorClinicService.get_business_entities hands out a copy.
+        
         Returns:
             {
                 "clinics": [{"clinic_id": "...", "name": "...", "doctors": [...]}],
@@ -160,8 +169,27 @@ class EkaEMRClient(BaseEMRClient):
                 "business": {"business_id": "...", "name": "..."}
             }
         """
-        raw_response = await self.get_business_entities_raw()
-        return parse_business_entities(raw_response)
+        # Workspace-wide and rarely changing, but requested by several tools
+        # per conversation; cache briefly per caller identity
+        key = caller_identity(self)
+        
+        async def fetch() -> Dict[str, Any]:
+            stored = business_entities_validators.get(key)
+            status, raw_response, etag = await self.get_with_etag(
+                "/dr/v1/business/entities",
+                etag=stored[0] if stored else None
+            )
+            if status == 304 and stored:
+                return stored[1]
+            if raw_response is None:
+                # 304 without a stored body (evicted meanwhile): fetch in full
+                raw_response = await self.get_business_entities_raw()
+            parsed = parse_business_entities(raw_response)
+            if etag:
+                business_entities_validators.set(key, (etag, parsed))
+            return parsed
+        
+        return await business_entities_cache.get_or_compute(key, fetch)
     
     async def get_clinic_details(
         self,
@@ -359,13 +387,20 @@ class EkaEMRClient(BaseEMRClient):
                 is_doctor_selected = True
                 selected_date = preferred_date
                 selected_slot = preferred_slot_time
-                # Fetch doctor profile
-                doctor_profile = await self.get_doctor_profile(doctor_id)
+                # Fetch doctor profile and business entities together; they are independent
+                doctor_profile, entities_response = await asyncio.gather(
+                    self.get_doctor_profile(doctor_id),
+                    self.get_business_entities(),
+                    return_exceptions=True
+                )
+                if isinstance(doctor_profile, BaseException):
+                    raise doctor_profile
                 if not doctor_profile or not doctor_profile.get('id'):
                     return {"error": f"Doctor with ID '{doctor_id}' not found"}
+                if isinstance(entities_response, BaseException):
+                    raise entities_response
 
-                entities_response = await self.get_business_entities()
-                all_clinics_list = entities_response.get('clinics', [])
+                all_clinics_list = entities_response['clinics']
 
                 doctor_clinics = find_doctor_clinics(all_clinics_list, doctor_id)
                 selected_doctor_details = build_doctor_details(doctor_profile, doctor_clinics, hospital_id)
@@ -403,9 +438,11 @@ class EkaEMRClient(BaseEMRClient):
             elif suggested_doctor_ids:       # doctor not selected but multiple suggestions
                 for suggested_doctor_id in suggested_doctor_ids:
                     try:
-                        suggested_doctor_profile = await self.get_doctor_profile(suggested_doctor_id)
-                        entities_response = await self.get_business_entities()
-                        all_clinics_list = entities_response.get('clinics', [])
+                        suggested_doctor_profile, entities_response = await asyncio.gather(
+                            self.get_doctor_profile(suggested_doctor_id),
+                            self.get_business_entities()
+                        )
+                        all_clinics_list = entities_response['clinics']
 
                         doctor_clinics = find_doctor_clinics(all_clinics_list, suggested_doctor_id)
                         suggested_doctor_details = build_doctor_details(suggested_doctor_profile, doctor_clinics)
@@ -553,17 +590,24 @@ class EkaEMRClient(BaseEMRClient):
         Returns:
             Filtered list of slots that are at least buffer_minutes away
         """
+        # Compare as seconds since midnight; a cutoff past midnight drops every slot
         now = datetime.now()
-        min_valid_time = now + timedelta(minutes=buffer_minutes)
+        min_valid_seconds = (
+            now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6
+            + buffer_minutes * 60
+        )
         
         filtered_slots = []
         for slot in slots:
             try:
-                # Parse slot time (HH:MM format)
-                slot_time = datetime.strptime(slot, "%H:%M").replace(
-                    year=now.year, month=now.month, day=now.day
-                )
-                if slot_time >= min_valid_time:
+                # Parse slot time (HH:MM format) by hand; strptime is costly per slot
+                hours, minutes = slot.split(":")
+                if not (hours.isdigit() and minutes.isdigit() and len(hours) <= 2 and len(minutes) <= 2):
+                    raise ValueError(slot)
+                hours, minutes = int(hours), int(minutes)
+                if hours > 23 or minutes > 59:
+                    raise ValueError(slot)
+                if hours * 3600 + minutes * 60 >= min_valid_seconds:
                     filtered_slots.append(slot)
             except ValueError:
                 # If parsing fails, include the slot anyway
@@ -841,32 +885,26 @@ class EkaEMRClient(BaseEMRClient):
             params=params
         )
         
-        # Filter by dates client-side if needed, and apply limit
+        # Filter by dates client-side if needed, and apply limit. Both steps run
+        # lazily so the scan stops as soon as `limit` matches have been produced.
         if isinstance(result, dict):
             appointments = result.get("appointments", [])
             
             # Apply date filtering client-side if dates provided
             if start_date or end_date:
-                from datetime import datetime
-                filtered = []
-                for appt in appointments:
-                    appt_time = appt.get("start_time", 0)
-                    if start_date:
-                        start_ts = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp())
-                        if appt_time < start_ts:
-                            continue
-                    if end_date:
-                        end_ts = int(datetime.strptime(end_date, "%Y-%m-%d").timestamp()) + 86400  # end of day
-                        if appt_time > end_ts:
-                            continue
-                    filtered.append(appt)
-                appointments = filtered
+                start_ts = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp()) if start_date else None
+                end_ts = int(datetime.strptime(end_date, "%Y-%m-%d").timestamp()) + 86400 if end_date else None  # end of day
+                appointments = (
+                    appt for appt in appointments
+                    if (start_ts is None or appt.get("start_time", 0) >= start_ts)
+                    and (end_ts is None or appt.get("start_time", 0) <= end_ts)
+                )
             
             # Apply limit
-            if limit and len(appointments) > limit:
-                appointments = appointments[:limit]
+            if limit:
+                appointments = islice(appointments, limit)
             
-            result["appointments"] = appointments
+            result["appointments"] = appointments if isinstance(appointments, list) else list(appointments)
         
         return result
     
@@ -45,6 +45,12 @@ class EkaSettings(BaseSettings):
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
     
+    # Tool Registration
+    register_disabled_tools: bool = Field(
+        default=False,
+        description="Register tools that ship disabled so they can be enabled at runtime"
+    )
+    
     # Workspace Configuration
     workspace_client_type: str = Field(
         default="ekaemr",
@@ -2,6 +2,8 @@ import os
 import json
 import argparse
 import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
 from fastmcp import FastMCP
 from fastmcp.dependencies import CurrentContext
 from fastmcp.server.context import Context
@@ -9,18 +11,32 @@ from starlette.requests import Request
 from starlette.responses import PlainTextResponse
 
 from eka_mcp_sdk.config.settings import settings
+from eka_mcp_sdk.utils.fastmcp_helper import ctx_debug, ctx_info, tool_result_serializer
 from eka_mcp_sdk.tools.doctor_tools import register_doctor_tools
 from eka_mcp_sdk.tools.abha_tools import register_abha_tools
+from eka_mcp_sdk.clients.client_factory import ClientFactory
+from eka_mcp_sdk.utils.tool_registration import ExtraHeadersMiddleware
 
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    """Release pooled HTTP connections held by cached clients on shutdown."""
+    try:
+        yield {}
+    finally:
+        await ClientFactory.close_all()
+
+
 def create_mcp_server() -> FastMCP:
     """Create and configure the MCP server."""
     
     mcp = FastMCP(
         name="Eka.care EMR API Server",
         stateless_http=True,
+        lifespan=server_lifespan,
+        tool_serializer=tool_result_serializer,
         instructions="""
             This is the Eka.care EMR API Server. It is used to manage the Eka.care EMR system.
             Provides capabilities to manage appointments, prescriptions, and patient records.
@@ -37,8 +53,8 @@ def create_mcp_server() -> FastMCP:
         Returns:
             Server configuration and status information
         """
-        await ctx.info("Fetching server information")
-        await ctx.debug(f"API Base URL: {settings.api_base_url}")
+        await ctx_info(ctx, lambda: "Fetching server information")
+        await ctx_debug(ctx, lambda: f"API Base URL: {settings.api_base_url}")
         
         return {
             "server_name": "Eka.care Healthcare API Server",
@@ -53,6 +69,8 @@ def create_mcp_server() -> FastMCP:
     async def health_check(request: Request) -> PlainTextResponse:
         return PlainTextResponse("OK")
 
+    mcp.add_middleware(ExtraHeadersMiddleware())
+    
     # Register all tool modules
     register_doctor_tools(mcp)
     register_abha_tools(mcp)
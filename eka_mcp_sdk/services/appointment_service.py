@@ -5,15 +5,18 @@ This module provides reusable service classes that can be used both by MCP tools
 and directly by other applications like CrewAI agents.
 """
 from typing import Any, Dict, Optional, List
+import asyncio
 import logging
 
 from ..clients.eka_emr_client import EkaEMRClient
 from ..auth.models import EkaAPIError
+from ..utils.async_cache import patient_summary_cache, doctor_summary_cache, clinic_summary_cache
 from ..utils.enrichment_helpers import (
-    get_cached_data, 
+    prefetch_shared_data, 
     extract_patient_summary, 
     extract_doctor_summary, 
-    extract_clinic_summary
+    extract_clinic_summary,
+    copy_summary
 )
 
 logger = logging.getLogger(__name__)
@@ -483,44 +486,53 @@ class AppointmentService:
             if not appointments_list:
                 return appointments_data
             
-            enriched_appointments = []
+            # Read the lookup keys once; they feed both the prefetch and the merge
+            patient_ids = [appointment.get("patient_id") for appointment in appointments_list]
+            doctor_ids = [appointment.get("doctor_id") for appointment in appointments_list]
+            clinic_ids = [appointment.get("clinic_id") for appointment in appointments_list]
+            
+            # Resolve each unique patient, doctor and clinic once, concurrently;
+            # identical in-flight lookups from other tool calls are coalesced
+            # by the shared caches
+            patients, doctors, clinics = await asyncio.gather(
+                prefetch_shared_data(
+                    self.client, self.client.get_patient_details, patient_ids,
+                    patient_summary_cache, extract_patient_summary
+                ),
+                prefetch_shared_data(
+                    self.client, self.client.get_doctor_profile, doctor_ids,
+                    doctor_summary_cache, extract_doctor_summary
+                ),
+                prefetch_shared_data(
+                    self.client, self.client.get_clinic_details, clinic_ids,
+                    clinic_summary_cache, extract_clinic_summary
+                )
+            )
             
-            # Cache for avoiding duplicate API calls
-            patients_cache = {}
-            doctors_cache = {}
-            clinics_cache = {}
+            enriched_appointments = []
             
-            for appointment in appointments_list:
-                enriched_appointment = appointment.copy()
+            for appointment, patient_id, doctor_id, clinic_id in zip(
+                appointments_list, patient_ids, doctor_ids, clinic_ids
+            ):
+                extra = {}
                 
                 # Enrich with patient details
-                patient_id = appointment.get("patient_id")
-                if patient_id:
-                    patient_info = await get_cached_data(
-                        self.client.get_patient_details, patient_id, patients_cache
-                    )
-                    if patient_info:
-                        enriched_appointment["patient_details"] = extract_patient_summary(patient_info)
+                patient_details = patients.get(patient_id)
+                if patient_details:
+                    extra["patient_details"] = copy_summary(patient_details)
                 
                 # Enrich with doctor details
-                doctor_id = appointment.get("doctor_id")
-                if doctor_id:
-                    doctor_info = await get_cached_data(
-                        self.client.get_doctor_profile, doctor_id, doctors_cache
-                    )
-                    if doctor_info:
-                        enriched_appointment["doctor_details"] = extract_doctor_summary(doctor_info)
+                doctor_details = doctors.get(doctor_id)
+                if doctor_details:
+                    extra["doctor_details"] = copy_summary(doctor_details)
                 
                 # Enrich with clinic details
-                clinic_id = appointment.get("clinic_id")
-                if clinic_id:
-                    clinic_info = await get_cached_data(
-                        self.client.get_clinic_details, clinic_id, clinics_cache
-                    )
-                    if clinic_info:
-                        enriched_appointment["clinic_details"] = extract_clinic_summary(clinic_info)
+                clinic_details = clinics.get(clinic_id)
+                if clinic_details:
+                    extra["clinic_details"] = copy_summary(clinic_details)
                 
-                enriched_appointments.append(enriched_appointment)
+                # One allocation per enriched row; rows with nothing to add are reused as-is
+                enriched_appointments.append({**appointment, **extra} if extra else appointment)
             
             # Return enriched data with original structure preserved
             if "appointments" in appointments_data:
@@ -534,7 +546,7 @@ class AppointmentService:
                 return enriched_appointments[0] if enriched_appointments else appointments_data
                 
         except Exception as e:
-            logger.warning(f"Failed to enrich appointments data: {str(e)}")
+            logger.warning("Failed to enrich appointments data: %s", e)
             return appointments_data
     
     # Book Health Package Appointment
@@ -5,18 +5,40 @@ This module provides reusable service classes that can be used both by MCP tools
 and directly by other applications like CrewAI agents.
 """
 from typing import Any, Dict, Optional, List
+import asyncio
+import copy
 import logging
 
 from ..clients.eka_emr_client import EkaEMRClient
 from ..auth.models import EkaAPIError
+from ..utils.async_cache import patient_summary_cache, doctor_summary_cache
+from ..utils.concurrency import bounded_gather, run_concurrently
 from ..utils.enrichment_helpers import (
-    get_cached_data, 
+    prefetch_shared_data, 
     extract_patient_summary, 
     extract_doctor_summary, 
+    copy_summary
 )
 
 logger = logging.getLogger(__name__)
 
+def _find_entity(entities: Optional[List[Dict[str, Any]]], entity_id: str, id_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Find a doctor or clinic in a business entities list by id.
+    
+    Args:
+        entities: The "doctors" or "clinics" list of get_business_entities
+        entity_id: Id to look for, matched against ``id`` and ``id_key``
+        id_key: Entity-specific id field ("doctor_id" or "clinic_id")
+        
+    Returns:
+        The first matching entity, or None
+    """
+    for entity in entities or []:
+        if entity.get("id") == entity_id or entity.get(id_key) == entity_id:
+            return entity
+    return None
+
 
 class DoctorClinicService:
     """Core service for doctor and clinic management operations."""
@@ -35,12 +57,14 @@ class DoctorClinicService:
         Get Clinic and Doctor details for the business.
         
         Returns:
-            Complete list of clinics and doctors associated with the business
+            Complete list of clinics and doctors associated with the business.
+            The client shares its cached result between callers, so this
+            returns a copy the caller is free to modify.
             
         Raises:
             EkaAPIError: If the API call fails
         """
-        return await self.client.get_business_entities()
+        return copy.deepcopy(await self.client.get_business_entities())
     
     async def get_doctor_profile_basic(self, doctor_id: str) -> Dict[str, Any]:
         """
@@ -160,46 +184,47 @@ class DoctorClinicService:
         Raises:
             EkaAPIError: If the API call fails
         """
-        # Get basic doctor profile
-        doctor_profile = await self.client.get_doctor_profile(doctor_id)
-        
-        comprehensive_profile = {
-            "doctor_profile": doctor_profile,
-            "clinics": [],
-            "services": [],
-            "recent_appointments": []
-        }
-        
-        # Get associated clinics and enrich them
-        if include_clinics:
+        async def fetch_clinics() -> List[Dict[str, Any]]:
             business_entities = await self.client.get_business_entities()
-            clinic_details = await self._enrich_doctor_clinics(doctor_id, business_entities)
-            comprehensive_profile["clinics"] = clinic_details
+            return await self._enrich_doctor_clinics(doctor_id, business_entities)
         
-        # Get doctor services
-        if include_services:
+        async def fetch_services() -> Any:
             try:
-                services = await self.client.get_doctor_services(doctor_id)
-                comprehensive_profile["services"] = services
+                return await self.client.get_doctor_services(doctor_id)
             except Exception as e:
-                logger.warning(f"Could not fetch services for doctor {doctor_id}: {str(e)}")
-                comprehensive_profile["services"] = []
+                logger.warning("Could not fetch services for doctor %s: %s", doctor_id, e)
+                return []
         
-        # Get recent appointments with patient details
-        if include_recent_appointments:
+        async def fetch_recent_appointments() -> List[Dict[str, Any]]:
             try:
                 recent_appointments = await self.client.get_appointments(
                     doctor_id=doctor_id,
                     page_no=0
                 )
                 # Enrich with patient details
-                enriched_appointments = await self._enrich_doctor_appointments(recent_appointments, appointment_limit)
-                comprehensive_profile["recent_appointments"] = enriched_appointments
+                return await self._enrich_doctor_appointments(recent_appointments, appointment_limit)
             except Exception as e:
-                logger.warning(f"Could not fetch recent appointments for doctor {doctor_id}: {str(e)}")
-                comprehensive_profile["recent_appointments"] = []
+                logger.warning("Could not fetch recent appointments for doctor %s: %s", doctor_id, e)
+                return []
         
-        return comprehensive_profile
+        async def skip() -> List[Any]:
+            return []
+        
+        # Profile and the requested branches are independent; run them together
+        # so a hard failure (e.g. profile not found) cancels the rest early
+        doctor_profile, clinics, services, recent_appointments = await run_concurrently(
+            self.client.get_doctor_profile(doctor_id),
+            fetch_clinics() if include_clinics else skip(),
+            fetch_services() if include_services else skip(),
+            fetch_recent_appointments() if include_recent_appointments else skip(),
+        )
+        
+        return {
+            "doctor_profile": doctor_profile,
+            "clinics": clinics,
+            "services": services,
+            "recent_appointments": recent_appointments
+        }
     
     async def get_comprehensive_clinic_profile(
         self,
@@ -225,39 +250,42 @@ class DoctorClinicService:
         Raises:
             EkaAPIError: If the API call fails
         """
-        # Get basic clinic details
-        clinic_details = await self.client.get_clinic_details(clinic_id)
-        
-        comprehensive_profile = {
-            "clinic_details": clinic_details,
-            "doctors": [],
-            "services": [],
-            "recent_appointments": []
-        }
-        
-        # Get associated doctors and their services
-        if include_doctors or include_services:
+        async def fetch_doctors() -> Dict[str, List[Any]]:
             business_entities = await self.client.get_business_entities()
-            doctors_info = await self._enrich_clinic_doctors(clinic_id, business_entities, include_services)
-            comprehensive_profile["doctors"] = doctors_info["doctors"]
-            if include_services:
-                comprehensive_profile["services"] = doctors_info["services"]
+            return await self._enrich_clinic_doctors(clinic_id, business_entities, include_services)
         
-        # Get recent appointments with patient and doctor details
-        if include_recent_appointments:
+        async def fetch_recent_appointments() -> List[Dict[str, Any]]:
             try:
                 recent_appointments = await self.client.get_appointments(
                     clinic_id=clinic_id,
                     page_no=0
                 )
                 # Enrich with patient and doctor details
-                enriched_appointments = await self._enrich_clinic_appointments(recent_appointments, appointment_limit)
-                comprehensive_profile["recent_appointments"] = enriched_appointments
+                return await self._enrich_clinic_appointments(recent_appointments, appointment_limit)
             except Exception as e:
-                logger.warning(f"Could not fetch recent appointments for clinic {clinic_id}: {str(e)}")
-                comprehensive_profile["recent_appointments"] = []
+                logger.warning("Could not fetch recent appointments for clinic %s: %s", clinic_id, e)
+                return []
+        
+        async def skip() -> Any:
+            return None
         
-        return comprehensive_profile
+        # Clinic details and the requested branches are independent; run them
+        # together so a hard failure cancels the rest early
+        clinic_details, doctors_info, recent_appointments = await run_concurrently(
+            self.client.get_clinic_details(clinic_id),
+            fetch_doctors() if include_doctors or include_services else skip(),
+            fetch_recent_appointments() if include_recent_appointments else skip(),
+        )
+        
+        # Assemble the result once from the branch results; each branch's
+        # intermediate data is already released when its coroutine returns
+        doctors_info = doctors_info or {}
+        return {
+            "clinic_details": clinic_details,
+            "doctors": doctors_info.get("doctors", []),
+            "services": doctors_info.get("services", []) if include_services else [],
+            "recent_appointments": recent_appointments or []
+        }
     
     async def _enrich_doctor_clinics(self, doctor_id: str, business_entities: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Enrich doctor profile with associated clinic details."""
@@ -265,26 +293,28 @@ class DoctorClinicService:
             clinics = []
             
             # Extract clinics associated with this doctor from business entities
-            doctor_clinics = []
-            if "doctors" in business_entities:
-                for doctor in business_entities["doctors"]:
-                    if doctor.get("id") == doctor_id or doctor.get("doctor_id") == doctor_id:
-                        doctor_clinics = doctor.get("clinics", [])
-                        break
+            doctor = _find_entity(business_entities.get("doctors"), doctor_id, "doctor_id")
+            doctor_clinics = doctor.get("clinics", []) if doctor else []
             
-            # Get detailed information for each clinic
-            for clinic_ref in doctor_clinics:
-                clinic_id = clinic_ref.get("id") or clinic_ref.get("clinic_id")
-                if clinic_id:
-                    try:
-                        clinic_details = await self.client.get_clinic_details(clinic_id)
-                        clinics.append(clinic_details)
-                    except Exception as e:
-                        logger.warning(f"Could not fetch details for clinic {clinic_id}: {str(e)}")
+            # Fetch every clinic's details concurrently; one failure doesn't drop the rest
+            clinic_ids = [
+                clinic_id for clinic_id in
+                (clinic_ref.get("id") or clinic_ref.get("clinic_id") for clinic_ref in doctor_clinics)
+                if clinic_id
+            ]
+            results = await bounded_gather(
+                (self.client.get_clinic_details(clinic_id) for clinic_id in clinic_ids),
+                return_exceptions=True
+            )
+            for clinic_id, result in zip(clinic_ids, results):
+                if isinstance(result, Exception):
+                    logger.warning("Could not fetch details for clinic %s: %s", clinic_id, result)
+                else:
+                    clinics.append(result)
             
             return clinics
         except Exception as e:
-            logger.warning(f"Failed to enrich doctor clinics: {str(e)}")
+            logger.warning("Failed to enrich doctor clinics: %s", e)
             return []
     
     async def _enrich_clinic_doctors(self, clinic_id: str, business_entities: Dict[str, Any], include_services: bool = True) -> Dict[str, List[Any]]:
@@ -294,38 +324,42 @@ class DoctorClinicService:
             all_services = []
             
             # Extract doctors associated with this clinic from business entities
-            clinic_doctors = []
-            if "clinics" in business_entities:
-                for clinic in business_entities["clinics"]:
-                    if clinic.get("id") == clinic_id or clinic.get("clinic_id") == clinic_id:
-                        clinic_doctors = clinic.get("doctors", [])
-                        break
+            clinic = _find_entity(business_entities.get("clinics"), clinic_id, "clinic_id")
+            clinic_doctors = clinic.get("doctors", []) if clinic else []
+            
+            doctor_ids = [
+                doctor_id for doctor_id in
+                (doctor_ref.get("id") or doctor_ref.get("doctor_id") for doctor_ref in clinic_doctors)
+                if doctor_id
+            ]
             
-            # Get detailed information for each doctor and their services
-            for doctor_ref in clinic_doctors:
-                doctor_id = doctor_ref.get("id") or doctor_ref.get("doctor_id")
-                if doctor_id:
-                    try:
-                        doctor_details = await self.client.get_doctor_profile(doctor_id)
-                        doctors.append(doctor_details)
-                        
-                        # Get services for this doctor if requested
-                        if include_services:
-                            try:
-                                doctor_services = await self.client.get_doctor_services(doctor_id)
-                                if isinstance(doctor_services, list):
-                                    all_services.extend(doctor_services)
-                                elif isinstance(doctor_services, dict) and "services" in doctor_services:
-                                    all_services.extend(doctor_services["services"])
-                            except Exception as e:
-                                logger.warning(f"Could not fetch services for doctor {doctor_id}: {str(e)}")
-                                
-                    except Exception as e:
-                        logger.warning(f"Could not fetch details for doctor {doctor_id}: {str(e)}")
+            async def fetch(doctor_id: str) -> List[Any]:
+                # Profile and services are independent, so overlap them too
+                calls = [self.client.get_doctor_profile(doctor_id)]
+                if include_services:
+                    calls.append(self.client.get_doctor_services(doctor_id))
+                return await asyncio.gather(*calls, return_exceptions=True)
+            
+            # Get detailed information for every doctor and their services in one wave
+            results = await bounded_gather(fetch(doctor_id) for doctor_id in doctor_ids)
+            for doctor_id, (doctor_details, *services) in zip(doctor_ids, results):
+                if isinstance(doctor_details, Exception):
+                    logger.warning("Could not fetch details for doctor %s: %s", doctor_id, doctor_details)
+                    continue
+                doctors.append(doctor_details)
+                
+                if services:
+                    doctor_services = services[0]
+                    if isinstance(doctor_services, Exception):
+                        logger.warning("Could not fetch services for doctor %s: %s", doctor_id, doctor_services)
+                    elif isinstance(doctor_services, list):
+                        all_services.extend(doctor_services)
+                    elif isinstance(doctor_services, dict) and "services" in doctor_services:
+                        all_services.extend(doctor_services["services"])
             
             return {"doctors": doctors, "services": all_services}
         except Exception as e:
-            logger.warning(f"Failed to enrich clinic doctors: {str(e)}")
+            logger.warning("Failed to enrich clinic doctors: %s", e)
             return {"doctors": [], "services": []}
     
     async def _enrich_doctor_appointments(self, appointments_data: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -339,27 +373,32 @@ class DoctorClinicService:
             
             if limit:
                 appointments_list = appointments_list[:limit]
+            if not appointments_list:
+                return []
             
-            enriched_appointments = []
-            patients_cache = {}
+            # Prefetch each unique patient once, concurrently
+            patients = await prefetch_shared_data(
+                self.client, self.client.get_patient_details,
+                (appointment.get("patient_id") for appointment in appointments_list),
+                patient_summary_cache, extract_patient_summary
+            )
             
-            for appointment in appointments_list:
-                enriched_appointment = appointment.copy()
+            enriched_appointments = [None] * len(appointments_list)
+            
+            for index, appointment in enumerate(appointments_list):
+                extra = {}
                 
                 # Enrich with patient details
-                patient_id = appointment.get("patient_id")
-                if patient_id:
-                    patient_info = await get_cached_data(
-                        self.client.get_patient_details, patient_id, patients_cache
-                    )
-                    if patient_info:
-                        enriched_appointment["patient_details"] = extract_patient_summary(patient_info)
+                patient_details = patients.get(appointment.get("patient_id"))
+                if patient_details:
+                    extra["patient_details"] = copy_summary(patient_details)
                 
-                enriched_appointments.append(enriched_appointment)
+                # Build the enriched row in one step; rows with nothing to add are reused as-is
+                enriched_appointments[index] = {**appointment, **extra} if extra else appointment
             
             return enriched_appointments
         except Exception as e:
-            logger.warning(f"Failed to enrich doctor appointments: {str(e)}")
+            logger.warning("Failed to enrich doctor appointments: %s", e)
             return []
     
     async def _enrich_clinic_appointments(self, appointments_data: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -373,35 +412,41 @@ class DoctorClinicService:
             
             if limit:
                 appointments_list = appointments_list[:limit]
+            if not appointments_list:
+                return []
+            
+            # Prefetch each unique patient and doctor once, all in one wave
+            patients, doctors = await asyncio.gather(
+                prefetch_shared_data(
+                    self.client, self.client.get_patient_details,
+                    (appointment.get("patient_id") for appointment in appointments_list),
+                    patient_summary_cache, extract_patient_summary
+                ),
+                prefetch_shared_data(
+                    self.client, self.client.get_doctor_profile,
+                    (appointment.get("doctor_id") for appointment in appointments_list),
+                    doctor_summary_cache, extract_doctor_summary
+                )
+            )
             
-            enriched_appointments = []
-            patients_cache = {}
-            doctors_cache = {}
+            enriched_appointments = [None] * len(appointments_list)
             
-            for appointment in appointments_list:
-                enriched_appointment = appointment.copy()
+            for index, appointment in enumerate(appointments_list):
+                extra = {}
                 
                 # Enrich with patient details
-                patient_id = appointment.get("patient_id")
-                if patient_id:
-                    patient_info = await get_cached_data(
-                        self.client.get_patient_details, patient_id, patients_cache
-                    )
-                    if patient_info:
-                        enriched_appointment["patient_details"] = extract_patient_summary(patient_info)
+                patient_details = patients.get(appointment.get("patient_id"))
+                if patient_details:
+                    extra["patient_details"] = copy_summary(patient_details)
                 
                 # Enrich with doctor details
-                doctor_id = appointment.get("doctor_id")
-                if doctor_id:
-                    doctor_info = await get_cached_data(
-                        self.client.get_doctor_profile, doctor_id, doctors_cache
-                    )
-                    if doctor_info:
-                        enriched_appointment["doctor_details"] = extract_doctor_summary(doctor_info)
+                doctor_details = doctors.get(appointment.get("doctor_id"))
+                if doctor_details:
+                    extra["doctor_details"] = copy_summary(doctor_details)
                 
-                enriched_appointments.append(enriched_appointment)
+                enriched_appointments[index] = {**appointment, **extra} if extra else appointment
             
             return enriched_appointments
         except Exception as e:
-            logger.warning(f"Failed to enrich clinic appointments: {str(e)}")
+            logger.warning("Failed to enrich clinic appointments: %s", e)
             return []
\ No newline at end of file
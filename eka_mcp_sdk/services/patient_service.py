@@ -5,16 +5,23 @@ This module provides reusable service classes that can be used both by MCP tools
 and directly by other applications like CrewAI agents.
 """
 from typing import Any, Dict, Optional, List
+import asyncio
 import logging
 
 from ..clients.eka_emr_client import EkaEMRClient
 from ..auth.models import EkaAPIError
+from ..utils.async_cache import (
+    patient_summary_cache, doctor_summary_cache, clinic_summary_cache,
+    patient_read_coalescer, scoped_key
+)
 from ..utils.enrichment_helpers import (
-    get_cached_data, 
+    prefetch_shared_data, 
     extract_doctor_summary, 
     extract_clinic_summary,
-    get_appointment_status_info
+    get_appointment_status_info,
+    copy_summary
 )
+from ..utils.concurrency import run_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -66,7 +73,7 @@ class PatientService:
         Raises:
             EkaAPIError: If the API call fails
         """
-        return await self.client.get_patient_details(patient_id)
+        return await self._get_patient_details(patient_id)
     
     async def get_comprehensive_patient_profile(
         self,
@@ -91,25 +98,27 @@ class PatientService:
         Raises:
             EkaAPIError: If the API call fails
         """
-        # Get basic patient details
-        patient_profile = await self.client.get_patient_details(patient_id)
-        
-        comprehensive_profile = {
-            "patient_profile": patient_profile,
-            "appointments": []
-        }
-        
-        if include_appointments:
-            # Get patient appointments
+        async def fetch_appointments() -> List[Dict[str, Any]]:
             appointments_result = await self.client.get_patient_appointments(
                 patient_id, appointment_limit
             )
-            
             # Enrich appointments with doctor and clinic details
-            enriched_appointments = await self._enrich_patient_appointments(
-                appointments_result
-            )
-            comprehensive_profile["appointments"] = enriched_appointments
+            return await self._enrich_patient_appointments(appointments_result)
+        
+        async def skip() -> List[Any]:
+            return []
+        
+        # The appointment history only needs patient_id, so fetch and enrich it
+        # while the profile is loading instead of after it
+        patient_profile, appointments = await run_concurrently(
+            self._get_patient_details(patient_id),
+            fetch_appointments() if include_appointments else skip()
+        )
+        
+        comprehensive_profile = {
+            "patient_profile": patient_profile,
+            "appointments": appointments
+        }
         
         return comprehensive_profile
     
@@ -126,7 +135,9 @@ class PatientService:
         Raises:
             EkaAPIError: If the API call fails
         """
-        return await self.client.add_patient(patient_data)
+        result = await self.client.add_patient(patient_data)
+        patient_read_coalescer.bump()
+        return result
     
     async def list_patients(
         self,
@@ -174,7 +185,10 @@ class PatientService:
         Raises:
             EkaAPIError: If the API call fails
         """
-        return await self.client.update_patient(patient_id, update_data)
+        result = await self.client.update_patient(patient_id, update_data)
+        patient_summary_cache.bump(patient_id)
+        patient_read_coalescer.bump()
+        return result
     
     async def archive_patient(
         self,
@@ -194,7 +208,10 @@ class PatientService:
         Raises:
             EkaAPIError: If the API call fails
         """
-        return await self.client.archive_patient(patient_id)
+        result = await self.client.archive_patient(patient_id)
+        patient_summary_cache.bump(patient_id)
+        patient_read_coalescer.bump()
+        return result
     
     async def get_patient_by_mobile(
         self,
@@ -214,7 +231,10 @@ class PatientService:
         Raises:
             EkaAPIError: If the API call fails
         """
-        return await self.client.get_patient_by_mobile(mobile, full_profile)
+        return await patient_read_coalescer.get_or_compute(
+            scoped_key(self.client, f"mobile:{mobile}:{full_profile}"),
+            lambda: self.client.get_patient_by_mobile(mobile, full_profile)
+        )
     
     async def mobile_number_verification(
         self,
@@ -291,6 +311,13 @@ class PatientService:
         """
         return await self.client.get_patient_benefits()
 
+    async def _get_patient_details(self, patient_id: str) -> Dict[str, Any]:
+        """Fetch a patient profile, sharing identical in-flight reads."""
+        return await patient_read_coalescer.get_or_compute(
+            scoped_key(self.client, patient_id),
+            lambda: self.client.get_patient_details(patient_id)
+        )
+
     async def _enrich_patient_appointments(
         self, 
         appointments_data: Dict[str, Any]
@@ -298,6 +325,10 @@ class PatientService:
         """
         Enrich patient appointments with doctor and clinic details.
         
+        appointments_data comes straight from the Eka API and is trusted: rows
+        are not re-validated, and each enriched row is a single shallow merge
+        of the original appointment and its extra fields.
+        
         Args:
             appointments_data: Raw appointments data from API
             
@@ -305,58 +336,69 @@ class PatientService:
             List of enriched appointments with doctor and clinic information
         """
         try:
-            # Handle different response structures
-            appointments_list = []
-            if isinstance(appointments_data, list):
-                appointments_list = appointments_data
-            elif isinstance(appointments_data, dict):
+            # Handle different response structures (most often a dict with "appointments")
+            if isinstance(appointments_data, dict):
                 if "appointments" in appointments_data:
-                    appointments_list = appointments_data.get("appointments", [])
+                    appointments_list = appointments_data["appointments"]
                 elif "data" in appointments_data:
-                    appointments_list = appointments_data.get("data", [])
+                    appointments_list = appointments_data["data"]
                 else:
                     appointments_list = [appointments_data] if appointments_data.get("appointment_id") else []
+            elif isinstance(appointments_data, list):
+                appointments_list = appointments_data
+            else:
+                appointments_list = []
             
             if not appointments_list:
                 return []
             
-            enriched_appointments = []
+            # Read the lookup keys once; they feed both the prefetch and the merge
+            doctor_ids = [appointment.get("doctor_id") for appointment in appointments_list]
+            clinic_ids = [appointment.get("clinic_id") for appointment in appointments_list]
             
-            # Cache for avoiding duplicate API calls
-            doctors_cache = {}
-            clinics_cache = {}
+            # Resolve each unique doctor and clinic once, concurrently
+            doctors, clinics = await asyncio.gather(
+                prefetch_shared_data(
+                    self.client, self.client.get_doctor_profile, doctor_ids,
+                    doctor_summary_cache, extract_doctor_summary
+                ),
+                prefetch_shared_data(
+                    self.client, self.client.get_clinic_details, clinic_ids,
+                    clinic_summary_cache, extract_clinic_summary
+                )
+            )
+            
+            enriched_appointments = []
+            # A history has only a handful of distinct statuses; build each once
+            status_infos: Dict[str, Dict[str, Any]] = {}
             
-            for appointment in appointments_list:
-                enriched_appointment = appointment.copy()
+            for appointment, doctor_id, clinic_id in zip(appointments_list, doctor_ids, clinic_ids):
+                extra = {}
                 
                 # Enrich with doctor details
-                doctor_id = appointment.get("doctor_id")
-                if doctor_id:
-                    doctor_info = await get_cached_data(
-                        self.client.get_doctor_profile, doctor_id, doctors_cache
-                    )
-                    if doctor_info:
-                        enriched_appointment["doctor_details"] = extract_doctor_summary(doctor_info)
+                doctor_details = doctors.get(doctor_id)
+                if doctor_details:
+                    extra["doctor_details"] = copy_summary(doctor_details)
                 
                 # Enrich with clinic details
-                clinic_id = appointment.get("clinic_id")
-                if clinic_id:
-                    clinic_info = await get_cached_data(
-                        self.client.get_clinic_details, clinic_id, clinics_cache
-                    )
-                    if clinic_info:
-                        enriched_appointment["clinic_details"] = extract_clinic_summary(clinic_info)
+                clinic_details = clinics.get(clinic_id)
+                if clinic_details:
+                    extra["clinic_details"] = copy_summary(clinic_details)
                 
                 # Add appointment status context
                 status = appointment.get("status", "")
-                enriched_appointment["status_info"] = get_appointment_status_info(status)
+                status_info = status_infos.get(status)
+                if status_info is None:
+                    status_info = status_infos[status] = get_appointment_status_info(status)
+                # Copy per row so editing one appointment leaves the others intact
+                extra["status_info"] = dict(status_info)
                 
-                enriched_appointments.append(enriched_appointment)
+                enriched_appointments.append({**appointment, **extra})
             
             return enriched_appointments
             
         except Exception as e:
-            logger.warning(f"Failed to enrich patient appointments: {str(e)}")
+            logger.warning("Failed to enrich patient appointments: %s", e)
             # Return original data if enrichment fails
             if isinstance(appointments_data, list):
                 return appointments_data
@@ -95,7 +95,7 @@ class PrescriptionService:
                 }
                 comprehensive_prescription["patient_details"] = patient_summary
             except Exception as e:
-                logger.warning(f"Could not fetch patient details for prescription {prescription_id}: {str(e)}")
+                logger.warning("Could not fetch patient details for prescription %s: %s", prescription_id, e)
         
         # Enrich with doctor details
         if include_doctor_details and prescription.get("doctor_id"):
@@ -105,7 +105,7 @@ class PrescriptionService:
                 doctor_summary["full_profile"] = doctor_info
                 comprehensive_prescription["doctor_details"] = doctor_summary
             except Exception as e:
-                logger.warning(f"Could not fetch doctor details for prescription {prescription_id}: {str(e)}")
+                logger.warning("Could not fetch doctor details for prescription %s: %s", prescription_id, e)
         
         # Enrich with clinic details
         if include_clinic_details and prescription.get("clinic_id"):
@@ -115,6 +115,6 @@ class PrescriptionService:
                 clinic_summary["full_profile"] = clinic_info
                 comprehensive_prescription["clinic_details"] = clinic_summary
             except Exception as e:
-                logger.warning(f"Could not fetch clinic details for prescription {prescription_id}: {str(e)}")
+                logger.warning("Could not fetch clinic details for prescription %s: %s", prescription_id, e)
         
         return comprehensive_prescription
\ No newline at end of file
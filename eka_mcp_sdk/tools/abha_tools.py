@@ -9,8 +9,10 @@ from fastmcp.dependencies import CurrentContext
 from fastmcp.server.context import Context
 
 from ..clients.abha_client import AbhaClient
+from ..clients.client_factory import ClientFactory
 from ..services.abha_service import AbhaService
 from ..auth.models import EkaAPIError
+from ..utils.fastmcp_helper import ctx_info
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +20,7 @@ logger = logging.getLogger(__name__)
 def _make_service() -> AbhaService:
     token: AccessToken | None = get_access_token()
     access_token = token.token if token else None
-    return AbhaService(AbhaClient(access_token=access_token))
+    return AbhaService(ClientFactory.get_client("abha", access_token, client_class=AbhaClient))
 
 
 def register_abha_tools(mcp: FastMCP) -> None:
@@ -42,7 +44,7 @@ def register_abha_tools(mcp: FastMCP) -> None:
         register abha, abha registration, new abha, get abha,
         abha card, download abha card, fetch abha card
         """
-        await ctx.info(f"[abha_send_otp] Sending OTP to {mobile_number}")
+        await ctx_info(ctx, lambda: f"[abha_send_otp] Sending OTP to {mobile_number}")
         try:
             service = _make_service()
             return await service.send_otp(mobile_number)
@@ -71,7 +73,7 @@ def register_abha_tools(mcp: FastMCP) -> None:
         in the response. Show the profile and inform the user their ABHA
         card is available. Do NOT make additional tool calls to fetch the card.
         """
-        await ctx.info(f"[abha_verify_otp] Verifying OTP for txn: {txn_id}")
+        await ctx_info(ctx, lambda: f"[abha_verify_otp] Verifying OTP for txn: {txn_id}")
         try:
             service = _make_service()
             return await service.verify_otp(otp, txn_id)
@@ -96,7 +98,7 @@ def register_abha_tools(mcp: FastMCP) -> None:
         field). Show the profile and inform the user their ABHA card is
         available. Do NOT make additional tool calls to fetch the card.
         """
-        await ctx.info(f"[abha_select_profile] Selecting profile: {phr_address}")
+        await ctx_info(ctx, lambda: f"[abha_select_profile] Selecting profile: {phr_address}")
         try:
             service = _make_service()
             return await service.select_profile(phr_address, txn_id)
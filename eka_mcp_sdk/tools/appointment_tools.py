@@ -1,31 +1,49 @@
 from eka_mcp_sdk.tools.models import ServiceBookingRequest
 from eka_mcp_sdk.tools.models import RescheduleAppointmentRequest
-from typing import Any, Dict, Optional, List, Union, Annotated
+from typing import Any, Dict, Optional, List, Annotated
 import logging
 from datetime import datetime, timedelta
 from fastmcp import FastMCP
 from fastmcp.server.dependencies import get_access_token, AccessToken
 from fastmcp.dependencies import CurrentContext
 from fastmcp.server.context import Context
-from ..utils.fastmcp_helper import readonly_tool_annotations, write_tool_annotations
+from ..utils.fastmcp_helper import readonly_tool_annotations, write_tool_annotations, eka_tool_handler, ctx_debug, ctx_info, normalize_id
 from ..utils.deduplicator import get_deduplicator
 
+from ..clients.client_factory import ClientFactory
 from ..clients.eka_emr_client import EkaEMRClient
 from ..auth.models import EkaAPIError
 from ..services.appointment_service import AppointmentService
 from .models import AppointmentBookingRequest
-from ..utils.tool_registration import get_extra_headers
-from ..utils.workspace_utils import get_workspace_id
-from ..utils.enrichment_helpers import (
-    get_cached_data,
-    extract_patient_summary,
-    extract_doctor_summary,
-    extract_clinic_summary
-)
-from ..clients.client_factory import ClientFactory
+from ..utils.tool_registration import disabled_tool, get_extra_headers
+from ..utils.workspace_utils import get_request_client
 
 logger = logging.getLogger(__name__)
 
+_READONLY_ANNOTATIONS = readonly_tool_annotations()
+_WRITE_ANNOTATIONS = write_tool_annotations()
+_DESTRUCTIVE_ANNOTATIONS = write_tool_annotations(destructive=True)
+
+
+def _make_service() -> AppointmentService:
+    return AppointmentService(get_request_client())
+
+
+def _make_emr_service() -> AppointmentService:
+    """Service on the Eka EMR client, used as a fallback for workspace clients."""
+    token: AccessToken | None = get_access_token()
+    return AppointmentService(ClientFactory.get_client(
+        "ekaemr", token.token if token else None, get_extra_headers(), EkaEMRClient
+    ))
+
+
+def _summarize_slots(result: Dict[str, Any]) -> str:
+    return f"{len(result['all_slots'])} slots available"
+
+
+def _summarize_appointments(result: Dict[str, Any]) -> str:
+    return f"{len(result['appointments'])} appointments"
+
 
 def find_alternate_slots(
     all_slots: List[Dict[str, Any]], 
@@ -110,8 +128,9 @@ def register_appointment_tools(mcp: FastMCP) -> None:
     
     @mcp.tool(
         tags={"appointment", "read", "slots", "availability"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_appointment_slots", summary=_summarize_slots)
     async def get_appointment_slots(
         doctor_id: Annotated[str, "Doctor ID (from get_business_entities)"],
         clinic_id: Annotated[str, "Clinic ID (from get_business_entities)"],
@@ -140,37 +159,13 @@ def register_appointment_tools(mcp: FastMCP) -> None:
         Returns: List of slots with start_time, end_time, and available (boolean).
 
         """
-        await ctx.info(f"[get_appointment_slots] Getting slots for doctor {doctor_id} at clinic {clinic_id} from {start_date} to {end_date}")
+        await ctx_info(ctx, lambda: f"[get_appointment_slots] Getting slots for doctor {doctor_id} at clinic {clinic_id} from {start_date} to {end_date}")
         
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service = AppointmentService(client)
-            result = await appointment_service.get_appointment_slots(doctor_id, clinic_id, start_date, end_date)
-            
-            slot_count = len(result.get('slots', [])) if isinstance(result, dict) else 0
-            await ctx.info(f"[get_appointment_slots] Completed successfully - {slot_count} slots available\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[get_appointment_slots] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        return await _make_service().get_appointment_slots(doctor_id, clinic_id, start_date, end_date)
     
     @mcp.tool(
         tags={"appointment", "read", "dates", "availability"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
     async def get_available_dates(
         doctor_id: Annotated[str, "Doctor ID (from get_business_entities)"],
@@ -197,7 +192,7 @@ def register_appointment_tools(mcp: FastMCP) -> None:
         Returns:
             List of dates (YYYY-MM-DD) with available slots
         """
-        await ctx.info(f"[get_available_dates] Getting available dates for doctor {doctor_id} at clinic {clinic_id}")
+        await ctx_info(ctx, lambda: f"[get_available_dates] Getting available dates for doctor {doctor_id} at clinic {clinic_id}")
         
         try:
             # Determine start date
@@ -229,16 +224,9 @@ def register_appointment_tools(mcp: FastMCP) -> None:
             start_datetime = f"{effective_start.strftime('%Y-%m-%d')}T00:00:00.000Z"
             end_datetime = f"{end_date_calc.strftime('%Y-%m-%d')}T23:59:59.000Z"
             
-            await ctx.debug(f"Fetching slots from {start_datetime} to {end_datetime}")
+            await ctx_debug(ctx, lambda: f"Fetching slots from {start_datetime} to {end_datetime}")
             
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service = AppointmentService(client)
+            appointment_service = _make_service()
             
             # Fetch available dates - client returns common format
             result = await appointment_service.get_available_dates(
@@ -248,7 +236,7 @@ def register_appointment_tools(mcp: FastMCP) -> None:
             # Limit to max_days
             available_dates = result.get('available_dates', [])[:max_days]
             
-            await ctx.info(f"[get_available_dates] Found {len(available_dates)} dates with availability\n")
+            await ctx_info(ctx, lambda: f"[get_available_dates] Found {len(available_dates)} dates with availability\n")
             
             return {
                 "available_dates": available_dates,
@@ -266,7 +254,7 @@ def register_appointment_tools(mcp: FastMCP) -> None:
     
     @mcp.tool(
         tags={"appointment", "read", "slots", "availability"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
     async def get_available_slots(
         doctor_id: Annotated[str, "Doctor ID (from get_business_entities)"],
@@ -287,7 +275,7 @@ def register_appointment_tools(mcp: FastMCP) -> None:
         Returns:
             Unified contract with all_slots (24h format), slot_categories, pricing, metadata
         """
-        await ctx.info(f"[get_available_slots] Getting slots for doctor {doctor_id} at clinic {clinic_id} on {date}")
+        await ctx_info(ctx, lambda: f"[get_available_slots] Getting slots for doctor {doctor_id} at clinic {clinic_id} on {date}")
         
         try:
             # Validate date format and not in past
@@ -303,21 +291,14 @@ def register_appointment_tools(mcp: FastMCP) -> None:
                     "error": f"Invalid date format '{date}'. Use YYYY-MM-DD format."
                 }
             
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service = AppointmentService(client)
+            appointment_service = _make_service()
             
             # Fetch slots - client returns common contract format
             response_data = await appointment_service.get_available_slots(
                 doctor_id, clinic_id, date
             )
             
-            await ctx.info(f"[get_available_slots] Found {len(response_data.get('all_slots', []))} available slots\n")
+            await ctx_info(ctx, lambda: f"[get_available_slots] Found {len(response_data.get('all_slots', []))} available slots\n")
             
             return response_data
             
@@ -329,7 +310,7 @@ def register_appointment_tools(mcp: FastMCP) -> None:
     
     @mcp.tool(
         tags={"appointment", "write", "book", "create"},
-        annotations=write_tool_annotations()
+        annotations=_WRITE_ANNOTATIONS
     )
     async def book_appointment(
         booking: AppointmentBookingRequest,
@@ -370,21 +351,14 @@ def register_appointment_tools(mcp: FastMCP) -> None:
         is_duplicate, cached_response = dedup.check_and_get_cached("book_appointment", **dedup_params)
         
         if is_duplicate and cached_response:
-            await ctx.info("DUPLICATE REQUEST - Returning cached appointment response")
+            await ctx_info(ctx, lambda: "DUPLICATE REQUEST - Returning cached appointment response")
             return cached_response
         
-        await ctx.info(f"[book_appointment] Booking for patient {booking.patient_id}")
-        await ctx.debug(f"Details: date={booking.date}, time={booking.start_time}-{booking.end_time}, mode={booking.mode}")
+        await ctx_info(ctx, lambda: f"[book_appointment] Booking for patient {booking.patient_id}")
+        await ctx_debug(ctx, lambda: f"Details: date={booking.date}, time={booking.start_time}-{booking.end_time}, mode={booking.mode}")
         
         try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service = AppointmentService(client)
+            appointment_service = _make_service()
             
             # Delegate to client - all orchestration logic is in the client layer
             result = await appointment_service.book_appointment_with_validation(
@@ -403,11 +377,11 @@ def register_appointment_tools(mcp: FastMCP) -> None:
             
             if result.get("success"):
                 appointment_id = result.get('data', {}).get('appointment_id') or result.get('data', {}).get('id')
-                await ctx.info(f"[book_appointment] Success - ID: {appointment_id}\n")
+                await ctx_info(ctx, lambda: f"[book_appointment] Success - ID: {appointment_id}\n")
                 # Cache the successful response
                 dedup.cache_response("book_appointment", result, **dedup_params)
             elif result.get("slot_unavailable"):
-                await ctx.info(f"[book_appointment] Slot unavailable, returning alternatives\n")
+                await ctx_info(ctx, lambda: f"[book_appointment] Slot unavailable, returning alternatives\n")
             else:
                 await ctx.error(f"[book_appointment] Failed: {result.get('error', {}).get('message')}\n")
             
@@ -415,21 +389,15 @@ def register_appointment_tools(mcp: FastMCP) -> None:
             
         except EkaAPIError as e:
             await ctx.error(f"[book_appointment] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+            return e.to_response()
 
         
-    @mcp.tool(
-        enabled=False,
+    @disabled_tool(
+        mcp,
         tags={"appointment", "read", "list", "enriched"},
-        annotations=readonly_tool_annotations() 
+        annotations=_READONLY_ANNOTATIONS 
     )
+    @eka_tool_handler("show_appointments_enriched", summary=_summarize_appointments)
     async def show_appointments_enriched(
         patient_id: Annotated[Optional[str], "Filter by patient (cannot use with dates)"] = None,
         doctor_id: Annotated[Optional[str], "Filter by doctor"] = None,
@@ -465,45 +433,22 @@ def register_appointment_tools(mcp: FastMCP) -> None:
                               f"patient={patient_id}" if patient_id else None,
                               f"dates={start_date} to {end_date}" if start_date or end_date else None] if f]
         filter_str = ", ".join(filters) if filters else "no filters"
-        await ctx.info(f"[show_appointments_enriched] Getting enriched appointments with {filter_str}")
-        
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service = AppointmentService(client)
-            result = await appointment_service.show_appointments_enriched(
-                doctor_id=doctor_id,
-                clinic_id=clinic_id,
-                patient_id=patient_id,
-                start_date=start_date,
-                end_date=end_date,
-                page_no=page_no
-            )
-            
-            appointment_count = len(result.get('appointments', [])) if isinstance(result, dict) else 0
-            await ctx.info(f"[show_appointments_enriched] Completed successfully - {appointment_count} appointments\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[show_appointments_enriched] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        await ctx_info(ctx, lambda: f"[show_appointments_enriched] Getting enriched appointments with {filter_str}")
+        
+        return await _make_service().show_appointments_enriched(
+            doctor_id=doctor_id,
+            clinic_id=clinic_id,
+            patient_id=patient_id,
+            start_date=start_date,
+            end_date=end_date,
+            page_no=page_no
+        )
     
     @mcp.tool(
         tags={"appointment", "read", "list", "basic"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("show_appointments_basic", summary=_summarize_appointments)
     async def show_appointments_basic(
         doctor_id: Annotated[Optional[str], "Doctor ID"] = None,
         clinic_id: Annotated[Optional[str], "Clinic ID"] = None,
@@ -533,46 +478,23 @@ def register_appointment_tools(mcp: FastMCP) -> None:
 
 
         """
-        await ctx.info(f"[show_appointments_basic] Getting basic appointments - page {page_no}")
-        
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service = AppointmentService(client)
-            result = await appointment_service.show_appointments_basic(
-                doctor_id=doctor_id,
-                clinic_id=clinic_id,
-                patient_id=patient_id,
-                start_date=start_date,
-                end_date=end_date,
-                page_no=page_no
-            )
-            
-            appointment_count = len(result.get('appointments', [])) if isinstance(result, dict) else 0
-            await ctx.info(f"[show_appointments_basic] Completed successfully - {appointment_count} appointments\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[show_appointments_basic] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        await ctx_info(ctx, lambda: f"[show_appointments_basic] Getting basic appointments - page {page_no}")
+        
+        return await _make_service().show_appointments_basic(
+            doctor_id=doctor_id,
+            clinic_id=clinic_id,
+            patient_id=patient_id,
+            start_date=start_date,
+            end_date=end_date,
+            page_no=page_no
+        )
     
-    @mcp.tool(
-        enabled=False,   
+    @disabled_tool(
+        mcp,
         tags={"appointment", "read", "details", "enriched"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_appointment_details_enriched")
     async def get_appointment_details_enriched(
         appointment_id: Annotated[str, "Appointment ID"],
         partner_id: Annotated[Optional[str], "Use partner appointment ID if set"] = None,
@@ -595,38 +517,16 @@ def register_appointment_tools(mcp: FastMCP) -> None:
         If the appointment is not found, returns an appropriate error response.
 
         """
-        await ctx.info(f"[get_appointment_details_enriched] Getting enriched details for appointment: {appointment_id}")
+        await ctx_info(ctx, lambda: f"[get_appointment_details_enriched] Getting enriched details for appointment: {appointment_id}")
         
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service = AppointmentService(client)
-            result = await appointment_service.get_appointment_details_enriched(appointment_id, partner_id)
-            
-            await ctx.info(f"[get_appointment_details_enriched] Completed successfully\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[get_appointment_details_enriched] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        return await _make_service().get_appointment_details_enriched(appointment_id, partner_id)
 
-    @mcp.tool(
-        enabled=False,
+    @disabled_tool(
+        mcp,
         tags={"appointment", "read", "details", "basic"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_appointment_details_basic")
     async def get_appointment_details_basic(
         appointment_id: Annotated[str, "Appointment ID"],
         partner_id: Annotated[Optional[str], "Use partner appointment ID if set"] = None,
@@ -646,38 +546,16 @@ def register_appointment_tools(mcp: FastMCP) -> None:
         Basic appointment details with entity IDs only
         If the appointment is not found, returns an appropriate error response.
         """
-        await ctx.info(f"[get_appointment_details_basic] Getting basic details for appointment: {appointment_id}")
+        await ctx_info(ctx, lambda: f"[get_appointment_details_basic] Getting basic details for appointment: {appointment_id}")
         
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service = AppointmentService(client)
-            result = await appointment_service.get_appointment_details_basic(appointment_id, partner_id)
-            
-            await ctx.info(f"[get_appointment_details_basic] Completed successfully\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[get_appointment_details_basic] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        return await _make_service().get_appointment_details_basic(appointment_id, partner_id)
     
-    @mcp.tool(
-        enabled=False,
+    @disabled_tool(
+        mcp,
         tags={"appointment", "read", "patient", "list", "enriched"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_patient_appointments_enriched", summary=_summarize_appointments)
     async def get_patient_appointments_enriched(
         patient_id: Annotated[str, "Patient ID"],
         limit: Annotated[Optional[int], "Max records to return"] = None,
@@ -699,43 +577,21 @@ def register_appointment_tools(mcp: FastMCP) -> None:
         List of enriched appointments for the patient with doctor and clinic information
         If the patient has no appointments, returns an empty appointments array.
         """
-        await ctx.info(f"[get_patient_appointments_enriched] Getting enriched appointments for patient: {patient_id}")
+        patient_id = normalize_id(patient_id, "patient_id")
+        await ctx_info(ctx, lambda: f"[get_patient_appointments_enriched] Getting enriched appointments for patient: {patient_id}")
         
         try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service = AppointmentService(client)
-            result = await appointment_service.get_patient_appointments_enriched(patient_id, limit)
-            
-            appointment_count = len(result) if isinstance(result, list) else 0
-            await ctx.info(f"[get_patient_appointments_enriched] Completed successfully - {appointment_count} appointments\n")
-            
-            return {"success": True, "data": result}
+            return await _make_service().get_patient_appointments_enriched(patient_id, limit)
         except EkaAPIError as e:
+            # Workspace clients may not support this lookup; retry on Eka EMR
             await ctx.error(f"[get_patient_appointments_enriched] Failed: {e.message}\n")
-            client = EkaEMRClient(access_token=token.token if token else None, custom_headers=get_extra_headers())
-            appointment_service = AppointmentService(client)
-            result = await appointment_service.get_patient_appointments_enriched(patient_id, limit)
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+            return await _make_emr_service().get_patient_appointments_enriched(patient_id, limit)
     
     @mcp.tool(
         tags={"appointment", "read", "patient", "list", "basic"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_patient_appointments_basic", summary=_summarize_appointments)
     async def get_patient_appointments_basic(
         patient_id: Annotated[str, "Patient ID"],
         limit: Annotated[Optional[int], "Max records to return"] = None,
@@ -757,39 +613,17 @@ def register_appointment_tools(mcp: FastMCP) -> None:
             If the patient has no appointments, returns an empty appointments array.
 
         """
-        await ctx.info(f"[get_patient_appointments_basic] Getting basic appointments for patient: {patient_id}")
+        patient_id = normalize_id(patient_id, "patient_id")
+        await ctx_info(ctx, lambda: f"[get_patient_appointments_basic] Getting basic appointments for patient: {patient_id}")
         
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service = AppointmentService(client)
-            result = await appointment_service.get_patient_appointments_basic(patient_id, limit)
-            
-            appointment_count = len(result) if isinstance(result, list) else 0
-            await ctx.info(f"[get_patient_appointments_basic] Completed successfully - {appointment_count} appointments\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[get_patient_appointments_basic] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        return await _make_service().get_patient_appointments_basic(patient_id, limit)
     
-    @mcp.tool(
-        enabled=False,
+    @disabled_tool(
+        mcp,
         tags={"appointment", "write", "update"},
-        annotations=write_tool_annotations()
+        annotations=_WRITE_ANNOTATIONS
     )
+    @eka_tool_handler("update_appointment")
     async def update_appointment(
         appointment_id: Annotated[str, "Appointment ID"],
         update_data: Annotated[Dict[str, Any], "Fields to update"],
@@ -813,37 +647,15 @@ def register_appointment_tools(mcp: FastMCP) -> None:
             If the update fails, returns an error response. This action should not be retried automatically without user confirmation.
 
         """
-        await ctx.info(f"[update_appointment] Updating appointment {appointment_id} - fields: {list(update_data.keys())}")
+        await ctx_info(ctx, lambda: f"[update_appointment] Updating appointment {appointment_id} - fields: {list(update_data.keys())}")
         
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service = AppointmentService(client)
-            result = await appointment_service.update_appointment(appointment_id, update_data, partner_id)
-            
-            await ctx.info(f"[update_appointment] Completed successfully\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[update_appointment] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        return await _make_service().update_appointment(appointment_id, update_data, partner_id)
     
     @mcp.tool(
         tags={"appointment", "write", "complete", "status"},
-        annotations=write_tool_annotations()
+        annotations=_WRITE_ANNOTATIONS
     )
+    @eka_tool_handler("complete_appointment")
     async def complete_appointment(
         appointment_id: Annotated[str, "Appointment ID"],
         completion_data: Annotated[Dict[str, Any], "Completion status and notes"],
@@ -866,37 +678,15 @@ def register_appointment_tools(mcp: FastMCP) -> None:
             If completion fails, returns an error response. This action should not be retried automatically without user confirmation.
 
         """
-        await ctx.info(f"[complete_appointment] Completing appointment: {appointment_id}")
+        await ctx_info(ctx, lambda: f"[complete_appointment] Completing appointment: {appointment_id}")
         
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service = AppointmentService(client)
-            result = await appointment_service.complete_appointment(appointment_id, completion_data)
-            
-            await ctx.info(f"[complete_appointment] Completed successfully\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[complete_appointment] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        return await _make_service().complete_appointment(appointment_id, completion_data)
     
     @mcp.tool(
         tags={"appointment", "write", "cancel", "destructive"},
-        annotations=write_tool_annotations(destructive=True)
+        annotations=_DESTRUCTIVE_ANNOTATIONS
     )
+    @eka_tool_handler("cancel_appointment")
     async def cancel_appointment(
         appointment_id: Annotated[str, "Appointment ID"],
         cancel_data: Annotated[Dict[str, Any], "Cancellation reason and notes"],
@@ -917,38 +707,16 @@ def register_appointment_tools(mcp: FastMCP) -> None:
         Returns:
             Cancellation confirmation with updated appointment status
         """
-        await ctx.info(f"[cancel_appointment] Cancelling appointment: {appointment_id}")
+        await ctx_info(ctx, lambda: f"[cancel_appointment] Cancelling appointment: {appointment_id}")
         
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service = AppointmentService(client)
-            result = await appointment_service.cancel_appointment(appointment_id, cancel_data)
-            
-            await ctx.info(f"[cancel_appointment] Completed successfully\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[cancel_appointment] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        return await _make_service().cancel_appointment(appointment_id, cancel_data)
     
     @mcp.tool(
         enabled=True,
         tags={"appointment", "write", "reschedule"},
-        annotations=write_tool_annotations()
+        annotations=_WRITE_ANNOTATIONS
     )
+    @eka_tool_handler("reschedule_appointment")
     async def reschedule_appointment(
         reschedule_data: RescheduleAppointmentRequest,
         ctx: Context = CurrentContext()
@@ -970,38 +738,15 @@ def register_appointment_tools(mcp: FastMCP) -> None:
             If rescheduling fails, returns an error response. This action should not be retried automatically without user confirmation.
 
         """
-        await ctx.info(f"[reschedule_appointment] Rescheduling appointment: {RescheduleAppointmentRequest}")
+        await ctx_info(ctx, lambda: f"[reschedule_appointment] Rescheduling appointment: {RescheduleAppointmentRequest}")
         
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service  = AppointmentService(client)
-            reschedule_data_json = reschedule_data.model_dump(exclude_none=True)
-            result = await appointment_service.reschedule_appointment(reschedule_data_json)
-            
-            await ctx.info("[reschedule_appointment] Completed successfully\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[reschedule_appointment] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        reschedule_data_json = reschedule_data.model_dump(exclude_none=True)
+        return await _make_service().reschedule_appointment(reschedule_data_json)
     
     # healtcheck Tools
     @mcp.tool(
         tags={"appointment", "write", "book", "create"},
-        annotations=write_tool_annotations()
+        annotations=_WRITE_ANNOTATIONS
     )
     async def book_service(
         booking: ServiceBookingRequest,
@@ -1032,32 +777,25 @@ def register_appointment_tools(mcp: FastMCP) -> None:
         is_duplicate, cached_response = dedup.check_and_get_cached("book_service", **input_params)
         
         if is_duplicate and cached_response:
-            await ctx.info("DUPLICATE REQUEST - Returning cached service booking response")
+            await ctx_info(ctx, lambda: "DUPLICATE REQUEST - Returning cached service booking response")
             return cached_response
         
-        await ctx.info(f"[book_service] Booking for patient {booking.patient_uhid}")
-        await ctx.debug(f"Details: {input_params}")
+        await ctx_info(ctx, lambda: f"[book_service] Booking for patient {booking.patient_uhid}")
+        await ctx_debug(ctx, lambda: f"Details: {input_params}")
         
         try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            appointment_service = AppointmentService(client)
+            appointment_service = _make_service()
             
             # Delegate to client - all orchestration logic is in the client layer
             result = await appointment_service.book_service(input_params, meta)
             
             if result.get("success"):
                 appointment_id = result.get('data', {}).get('appointment_id') or result.get('data', {}).get('id')
-                await ctx.info(f"[book_service] Success - ID: {appointment_id}\n")
+                await ctx_info(ctx, lambda: f"[book_service] Success - ID: {appointment_id}\n")
                 # Cache the successful response
                 dedup.cache_response("book_health_package", result, **input_params)
             elif result.get("slot_unavailable"):
-                await ctx.info("[book_health_package] Slot unavailable, returning alternatives\n")
+                await ctx_info(ctx, lambda: "[book_health_package] Slot unavailable, returning alternatives\n")
             else:
                 await ctx.error(f"[book_health_package] Failed: {result.get('error', {}).get('message')}\n")
             
@@ -1065,14 +803,7 @@ def register_appointment_tools(mcp: FastMCP) -> None:
             
         except EkaAPIError as e:
             await ctx.error(f"[book_health_package] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+            return e.to_response()
 
 # This function is now handled by the AppointmentService class
 # Keeping for backward compatibility if needed
@@ -1081,76 +812,7 @@ async def _enrich_appointments_data(client: EkaEMRClient, appointments_data: Dic
     Unified function to enrich appointment data with patient, doctor, and clinic details.
     Works with both single appointments and lists of appointments.
     """
-    try:
-        # Handle different input structures
-        appointments_list = []
-        if "appointments" in appointments_data:
-            appointments_list = appointments_data.get("appointments", [])
-        elif isinstance(appointments_data, list):
-            appointments_list = appointments_data
-        elif isinstance(appointments_data, dict) and appointments_data.get("appointment_id"):
-            # Single appointment
-            appointments_list = [appointments_data]
-        else:
-            # Unknown structure, return as is
-            return appointments_data
-        
-        if not appointments_list:
-            return appointments_data
-        
-        enriched_appointments = []
-        
-        # Cache for avoiding duplicate API calls
-        patients_cache = {}
-        doctors_cache = {}
-        clinics_cache = {}
-        
-        for appointment in appointments_list:
-            enriched_appointment = appointment.copy()
-            
-            # Enrich with patient details
-            patient_id = appointment.get("patient_id")
-            if patient_id:
-                patient_info = await get_cached_data(
-                    client.get_patient_details, patient_id, patients_cache
-                )
-                if patient_info:
-                    enriched_appointment["patient_details"] = extract_patient_summary(patient_info)
-            
-            # Enrich with doctor details
-            doctor_id = appointment.get("doctor_id")
-            if doctor_id:
-                doctor_info = await get_cached_data(
-                    client.get_doctor_profile, doctor_id, doctors_cache
-                )
-                if doctor_info:
-                    enriched_appointment["doctor_details"] = extract_doctor_summary(doctor_info)
-            
-            # Enrich with clinic details
-            clinic_id = appointment.get("clinic_id")
-            if clinic_id:
-                clinic_info = await get_cached_data(
-                    client.get_clinic_details, clinic_id, clinics_cache
-                )
-                if clinic_info:
-                    enriched_appointment["clinic_details"] = extract_clinic_summary(clinic_info)
-            
-            enriched_appointments.append(enriched_appointment)
-        
-        # Return enriched data with original structure preserved
-        if "appointments" in appointments_data:
-            result = appointments_data.copy()
-            result["appointments"] = enriched_appointments
-            return result
-        elif isinstance(appointments_data, list):
-            return enriched_appointments
-        else:
-            # Single appointment case
-            return enriched_appointments[0] if enriched_appointments else appointments_data
-        
-    except Exception as e:
-        logger.warning(f"Failed to enrich appointments data: {str(e)}")
-        return appointments_data
+    return await AppointmentService(client)._enrich_appointments_data(appointments_data)
 
 
 
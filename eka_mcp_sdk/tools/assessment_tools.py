@@ -5,19 +5,33 @@ from fastmcp.server.dependencies import get_access_token, AccessToken
 from fastmcp.dependencies import CurrentContext
 from fastmcp.server.context import Context
 
+from ..clients.client_factory import ClientFactory
 from ..clients.eka_emr_client import EkaEMRClient
-from ..auth.models import EkaAPIError
 from ..services.assessment_service import AssessmentService
+from ..utils.fastmcp_helper import ctx_info, eka_tool_handler
 from ..utils.tool_registration import get_extra_headers
 
 logger = logging.getLogger(__name__)
 
+
+def _make_service() -> AssessmentService:
+    token: AccessToken | None = get_access_token()
+    return AssessmentService(ClientFactory.get_client(
+        "ekaemr", token.token if token else None, get_extra_headers(), EkaEMRClient
+    ))
+
+
+def _summarize_assessments(result: Dict[str, Any]) -> str:
+    return f"{len(result['assessments'])} grouped assessments"
+
+
 def register_assessment_tools(mcp: FastMCP) -> None:
     """Register Assessment MCP tools."""
     
     @mcp.tool(
         description="Fetch and group assessments by patient and/or practitioner"
     )
+    @eka_tool_handler("fetch_grouped_assessments", summary=_summarize_assessments)
     async def fetch_grouped_assessments(
         practitioner_uuid: Annotated[Optional[str], "UUID of the practitioner"] = None,
         patient_uuid: Annotated[Optional[str], "UUID of the patient"] = None,
@@ -32,36 +46,15 @@ def register_assessment_tools(mcp: FastMCP) -> None:
                               f"patient={patient_uuid}" if patient_uuid else None,
                               f"status={status}"] if f]
         filter_str = ", ".join(filters) if filters else "no filters"
-        await ctx.info(f"Fetching grouped assessments with {filter_str}")
+        await ctx_info(ctx, lambda: f"Fetching grouped assessments with {filter_str}")
         
-        try:
-            token: AccessToken | None = get_access_token()
-            client = EkaEMRClient(access_token=token.token if token else None, custom_headers=get_extra_headers())
-
-            assessment_service = AssessmentService(client)
-            
-            result = await assessment_service.fetch_grouped_assessments(
-                practitioner_uuid=practitioner_uuid,
-                patient_uuid=patient_uuid,
-                unique_identifier=unique_identifier,
-                transaction_id=transaction_id,
-                wfids=wfids,
-                status=status
-            )
-            
-            assessment_count = len(result.get('assessments', [])) if isinstance(result, dict) else 0
-            await ctx.info(f"Retrieved {assessment_count} grouped assessments")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"Failed to fetch assessments: {e.message}")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        return await _make_service().fetch_grouped_assessments(
+            practitioner_uuid=practitioner_uuid,
+            patient_uuid=patient_uuid,
+            unique_identifier=unique_identifier,
+            transaction_id=transaction_id,
+            wfids=wfids,
+            status=status
+        )
 
 
@@ -1,31 +1,38 @@
 from typing import Any, Dict, Optional, List, Annotated
 import logging
 from fastmcp import FastMCP
-from fastmcp.server.dependencies import get_access_token, AccessToken
 from fastmcp.dependencies import CurrentContext
 from fastmcp.server.context import Context
-from ..utils.fastmcp_helper import readonly_tool_annotations
-
-from ..utils.enrichment_helpers import get_cached_data, extract_patient_summary, extract_doctor_summary
+from ..utils.fastmcp_helper import readonly_tool_annotations, eka_tool_handler, normalize_id, ctx_info
 
 from ..clients.eka_emr_client import EkaEMRClient
 from ..auth.models import EkaAPIError
 from ..services.doctor_clinic_service import DoctorClinicService
-from ..utils.tool_registration import get_extra_headers, get_supports_elicitation
-from ..services.appointment_service import AppointmentService
-from ..utils.workspace_utils import get_workspace_id
-from ..clients.client_factory import ClientFactory
+from ..utils.tool_registration import disabled_tool, get_supports_elicitation
+from ..utils.workspace_utils import get_request_client
 
 logger = logging.getLogger(__name__)
 
+# Shared by every read-only tool below instead of rebuilding one per decorator
+_READONLY_ANNOTATIONS = readonly_tool_annotations()
+
+
+def _make_service() -> DoctorClinicService:
+    return DoctorClinicService(get_request_client())
+
+
+def _summarize_business_entities(result: Dict[str, Any]) -> str:
+    return f"{len(result['clinics'])} clinics, {len(result['doctors'])} doctors"
+
 
 def register_doctor_clinic_tools(mcp: FastMCP) -> None:
     """Register Doctor and Clinic Information MCP tools."""
     
     @mcp.tool(
         tags={"doctor", "clinic", "read", "list", "primary"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_business_entities", summary=_summarize_business_entities)
     async def get_business_entities(
         ctx: Context = CurrentContext()
     ) -> Dict[str, Any]:
@@ -43,40 +50,14 @@ def register_doctor_clinic_tools(mcp: FastMCP) -> None:
         What to Return
         Returns a structured list of doctors and clinics with their identifiers and associations.
         """
-        await ctx.info(f"[get_business_entities] Getting business entities (clinics and doctors)")
-        
-        try:
-            
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            doctor_clinic_service = DoctorClinicService(client)
-            result = await doctor_clinic_service.get_business_entities()
-            
-            clinic_count = len(result.get('clinics', [])) if isinstance(result, dict) else 0
-            doctor_count = len(result.get('doctors', [])) if isinstance(result, dict) else 0
-            await ctx.info(f"[get_business_entities] Completed successfully - {clinic_count} clinics, {doctor_count} doctors\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[get_business_entities] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        await ctx_info(ctx, lambda: f"[get_business_entities] Getting business entities (clinics and doctors)")
+        return await _make_service().get_business_entities()
     
     @mcp.tool(
         tags={"doctor", "read", "profile"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_doctor_profile_basic")
     async def get_doctor_profile_basic(
         doctor_id: Annotated[str, "Doctor UUID"],
         ctx: Context = CurrentContext()
@@ -94,37 +75,15 @@ def register_doctor_clinic_tools(mcp: FastMCP) -> None:
         What to Return
         Returns basic doctor profile data without clinic associations or appointment history.
         """
-        await ctx.info(f"[get_doctor_profile_basic] Getting basic doctor profile for: {doctor_id}")
-        
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            doctor_clinic_service = DoctorClinicService(client)
-            result = await doctor_clinic_service.get_doctor_profile_basic(doctor_id)
-            
-            await ctx.info(f"[get_doctor_profile_basic] Completed successfully\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[get_doctor_profile_basic] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        doctor_id = normalize_id(doctor_id, "doctor_id")
+        await ctx_info(ctx, lambda: f"[get_doctor_profile_basic] Getting basic doctor profile for: {doctor_id}")
+        return await _make_service().get_doctor_profile_basic(doctor_id)
     
     @mcp.tool(
         tags={"clinic", "read", "profile"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_clinic_details_basic")
     async def get_clinic_details_basic(
         clinic_id: Annotated[str, "Clinic UUID"],
         ctx: Context = CurrentContext()
@@ -142,38 +101,16 @@ def register_doctor_clinic_tools(mcp: FastMCP) -> None:
         What to Return
         Returns basic clinic profile data without doctor associations or appointment history.
         """
-        await ctx.info(f"[get_clinic_details_basic] Getting basic clinic details for: {clinic_id}")
-        
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            doctor_clinic_service = DoctorClinicService(client)
-            result = await doctor_clinic_service.get_clinic_details_basic(clinic_id)
-            
-            await ctx.info(f"[get_clinic_details_basic] Completed successfully\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[get_clinic_details_basic] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        clinic_id = normalize_id(clinic_id, "clinic_id")
+        await ctx_info(ctx, lambda: f"[get_clinic_details_basic] Getting basic clinic details for: {clinic_id}")
+        return await _make_service().get_clinic_details_basic(clinic_id)
     
-    @mcp.tool(
-        enabled=False,
+    @disabled_tool(
+        mcp,
         tags={"doctor", "read", "services"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_doctor_services")
     async def get_doctor_services(
         doctor_id: Annotated[str, "Doctor UUID"],
         ctx: Context = CurrentContext()
@@ -191,39 +128,16 @@ def register_doctor_clinic_tools(mcp: FastMCP) -> None:
         What to Return
         Returns a list of services and specialties associated with the doctor.
         """
-        await ctx.info(f"[get_doctor_services] Getting services for doctor: {doctor_id}")
-        
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            doctor_clinic_service = DoctorClinicService(client)
-            result = await doctor_clinic_service.get_doctor_services(doctor_id)
-            
-            service_count = len(result) if isinstance(result, list) else 0
-            await ctx.info(f"[get_doctor_services] Completed successfully - {service_count} services\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[get_doctor_services] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        doctor_id = normalize_id(doctor_id, "doctor_id")
+        await ctx_info(ctx, lambda: f"[get_doctor_services] Getting services for doctor: {doctor_id}")
+        return await _make_service().get_doctor_services(doctor_id)
     
-    @mcp.tool(
-        enabled=False,
+    @disabled_tool(
+        mcp,
         tags={"doctor", "read", "profile", "comprehensive"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_comprehensive_doctor_profile")
     async def get_comprehensive_doctor_profile(
         doctor_id: Annotated[str, "Doctor UUID"],
         include_clinics: Annotated[bool, "Include clinic associations"] = True,
@@ -249,40 +163,18 @@ def register_doctor_clinic_tools(mcp: FastMCP) -> None:
         What to Return
         Returns a fully enriched doctor profile with optional clinic, service, and appointment data.
         """
-        await ctx.info(f"[get_comprehensive_doctor_profile] Getting comprehensive profile for doctor: {doctor_id}")
-        
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            doctor_clinic_service = DoctorClinicService(client)
-            result = await doctor_clinic_service.get_comprehensive_doctor_profile(
-                doctor_id, include_clinics, include_services, include_recent_appointments, appointment_limit
-            )
-            
-            await ctx.info(f"[get_comprehensive_doctor_profile] Completed successfully\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[get_comprehensive_doctor_profile] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        doctor_id = normalize_id(doctor_id, "doctor_id")
+        await ctx_info(ctx, lambda: f"[get_comprehensive_doctor_profile] Getting comprehensive profile for doctor: {doctor_id}")
+        return await _make_service().get_comprehensive_doctor_profile(
+            doctor_id, include_clinics, include_services, include_recent_appointments, appointment_limit
+        )
     
-    @mcp.tool(
-        enabled=False,
+    @disabled_tool(
+        mcp,
         tags={"clinic", "read", "profile", "comprehensive"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_comprehensive_clinic_profile")
     async def get_comprehensive_clinic_profile(
         clinic_id: Annotated[str, "Clinic ID"],
         include_doctors: Annotated[bool, "Include associated doctors"] = True,
@@ -305,187 +197,33 @@ def register_doctor_clinic_tools(mcp: FastMCP) -> None:
         What to Return
         Returns a fully enriched clinic profile with optional doctor, service, and appointment data.
         """
-        await ctx.info(f"[get_comprehensive_clinic_profile] Getting comprehensive profile for clinic: {clinic_id}")
-        
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            doctor_clinic_service = DoctorClinicService(client)
-            result = await doctor_clinic_service.get_comprehensive_clinic_profile(
-                clinic_id, include_doctors, include_services, include_recent_appointments, appointment_limit
-            )
-            
-            await ctx.info(f"[get_comprehensive_clinic_profile] Completed successfully\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[get_comprehensive_clinic_profile] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        clinic_id = normalize_id(clinic_id, "clinic_id")
+        await ctx_info(ctx, lambda: f"[get_comprehensive_clinic_profile] Getting comprehensive profile for clinic: {clinic_id}")
+        return await _make_service().get_comprehensive_clinic_profile(
+            clinic_id, include_doctors, include_services, include_recent_appointments, appointment_limit
+        )
 
 
 # These functions are now handled by the DoctorClinicService class
 # Keeping for backward compatibility if needed
 async def _enrich_doctor_clinics(client: EkaEMRClient, doctor_id: str, business_entities: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Enrich doctor profile with associated clinic details."""
-    try:
-        clinics = []
-        
-        # Extract clinics associated with this doctor from business entities
-        doctor_clinics = []
-        if "doctors" in business_entities:
-            for doctor in business_entities["doctors"]:
-                if doctor.get("id") == doctor_id or doctor.get("doctor_id") == doctor_id:
-                    doctor_clinics = doctor.get("clinics", [])
-                    break
-        
-        # Get detailed information for each clinic
-        for clinic_ref in doctor_clinics:
-            clinic_id = clinic_ref.get("id") or clinic_ref.get("clinic_id")
-            if clinic_id:
-                try:
-                    clinic_details = await client.get_clinic_details(clinic_id)
-                    clinics.append(clinic_details)
-                except Exception as e:
-                    logger.warning(f"Could not fetch details for clinic {clinic_id}: {str(e)}")
-        
-        return clinics
-    except Exception as e:
-        logger.warning(f"Failed to enrich doctor clinics: {str(e)}")
-        return []
+    return await DoctorClinicService(client)._enrich_doctor_clinics(doctor_id, business_entities)
 
 
 async def _enrich_clinic_doctors(client: EkaEMRClient, clinic_id: str, business_entities: Dict[str, Any], include_services: bool = True) -> Dict[str, List[Any]]:
     """Enrich clinic profile with associated doctor details and services."""
-    try:
-        doctors = []
-        all_services = []
-        
-        # Extract doctors associated with this clinic from business entities
-        clinic_doctors = []
-        if "clinics" in business_entities:
-            for clinic in business_entities["clinics"]:
-                if clinic.get("id") == clinic_id or clinic.get("clinic_id") == clinic_id:
-                    clinic_doctors = clinic.get("doctors", [])
-                    break
-        
-        # Get detailed information for each doctor and their services
-        for doctor_ref in clinic_doctors:
-            doctor_id = doctor_ref.get("id") or doctor_ref.get("doctor_id")
-            if doctor_id:
-                try:
-                    doctor_details = await client.get_doctor_profile(doctor_id)
-                    doctors.append(doctor_details)
-                    
-                    # Get services for this doctor if requested
-                    if include_services:
-                        try:
-                            doctor_services = await client.get_doctor_services(doctor_id)
-                            if isinstance(doctor_services, list):
-                                all_services.extend(doctor_services)
-                            elif isinstance(doctor_services, dict) and "services" in doctor_services:
-                                all_services.extend(doctor_services["services"])
-                        except Exception as e:
-                            logger.warning(f"Could not fetch services for doctor {doctor_id}: {str(e)}")
-                            
-                except Exception as e:
-                    logger.warning(f"Could not fetch details for doctor {doctor_id}: {str(e)}")
-        
-        return {"doctors": doctors, "services": all_services}
-    except Exception as e:
-        logger.warning(f"Failed to enrich clinic doctors: {str(e)}")
-        return {"doctors": [], "services": []}
+    return await DoctorClinicService(client)._enrich_clinic_doctors(clinic_id, business_entities, include_services)
 
 
 async def _enrich_doctor_appointments(client: EkaEMRClient, appointments_data: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
     """Enrich doctor's recent appointments with patient details."""
-    try:
-        appointments_list = []
-        if "appointments" in appointments_data:
-            appointments_list = appointments_data.get("appointments", [])
-        elif isinstance(appointments_data, list):
-            appointments_list = appointments_data
-        
-        if limit:
-            appointments_list = appointments_list[:limit]
-        
-        enriched_appointments = []
-        patients_cache = {}
-        
-        for appointment in appointments_list:
-            enriched_appointment = appointment.copy()
-            
-            # Enrich with patient details
-            patient_id = appointment.get("patient_id")
-            if patient_id:
-                patient_info = await get_cached_data(
-                    client.get_patient_details, patient_id, patients_cache
-                )
-                if patient_info:
-                    enriched_appointment["patient_details"] = extract_patient_summary(patient_info)
-            
-            enriched_appointments.append(enriched_appointment)
-        
-        return enriched_appointments
-    except Exception as e:
-        logger.warning(f"Failed to enrich doctor appointments: {str(e)}")
-        return []
+    return await DoctorClinicService(client)._enrich_doctor_appointments(appointments_data, limit)
 
 
 async def _enrich_clinic_appointments(client: EkaEMRClient, appointments_data: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
     """Enrich clinic's recent appointments with patient and doctor details."""
-    try:
-        appointments_list = []
-        if "appointments" in appointments_data:
-            appointments_list = appointments_data.get("appointments", [])
-        elif isinstance(appointments_data, list):
-            appointments_list = appointments_data
-        
-        if limit:
-            appointments_list = appointments_list[:limit]
-        
-        enriched_appointments = []
-        patients_cache = {}
-        doctors_cache = {}
-        
-        for appointment in appointments_list:
-            enriched_appointment = appointment.copy()
-            
-            # Enrich with patient details
-            patient_id = appointment.get("patient_id")
-            if patient_id:
-                patient_info = await get_cached_data(
-                    client.get_patient_details, patient_id, patients_cache
-                )
-                if patient_info:
-                    enriched_appointment["patient_details"] = extract_patient_summary(patient_info)
-            
-            # Enrich with doctor details
-            doctor_id = appointment.get("doctor_id")
-            if doctor_id:
-                doctor_info = await get_cached_data(
-                    client.get_doctor_profile, doctor_id, doctors_cache
-                )
-                if doctor_info:
-                    enriched_appointment["doctor_details"] = extract_doctor_summary(doctor_info)
-            
-            enriched_appointments.append(enriched_appointment)
-        
-        return enriched_appointments
-    except Exception as e:
-        logger.warning(f"Failed to enrich clinic appointments: {str(e)}")
-        return []
+    return await DoctorClinicService(client)._enrich_clinic_appointments(appointments_data, limit)
 
 ### DOCTOR DISCOVERY / Availability TOOLS ###
 
@@ -494,7 +232,7 @@ def register_discovery_tools(mcp: FastMCP) -> None:
     
     @mcp.tool(
         tags={"doctor", "availability", "elicitation"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
     async def doctor_availability_elicitation(
         suggested_doctor_ids: Annotated[Optional[List[str]], "List of suggested doctor ids, as matching results of searching doctors"] = None,
@@ -535,17 +273,13 @@ def register_discovery_tools(mcp: FastMCP) -> None:
         Returns: Interactive selector showing available dates and time slots.
         """
         meta = ctx.request_context.meta
-        await ctx.info(f"[doctor_availability_elicitation] suggested_doctor_ids: {suggested_doctor_ids}, doctor_id: {doctor_id}, hospital_id: {hospital_id}, date: {preferred_date}, slot: {preferred_slot_time}, meta: {meta}")
+        logger.debug(
+            "[doctor_availability_elicitation] suggested_doctor_ids: %s, doctor_id: %s, hospital_id: %s, date: %s, slot: %s, meta: %s",
+            suggested_doctor_ids, doctor_id, hospital_id, preferred_date, preferred_slot_time, meta
+        )
         
         try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            doctor_clinic_service = DoctorClinicService(client)
+            doctor_clinic_service = _make_service()
             
             # Delegate to client - all orchestration logic is in the client layer
             result = await doctor_clinic_service.doctor_availability_elicitation(
@@ -558,12 +292,12 @@ def register_discovery_tools(mcp: FastMCP) -> None:
                 meta=meta
             )
             
-            await ctx.info("[doctor_availability_elicitation] Completed\n")
+            logger.info("[doctor_availability_elicitation] Completed")
             
             return result
             
         except EkaAPIError as e:
-            await ctx.error(f"[doctor_availability_elicitation] Failed: {e.message}\n")
+            await ctx.error(f"[doctor_availability_elicitation] Failed: {e.message}")
             return {
                 "error": e.message,
                 "status_code": e.status_code,
@@ -573,7 +307,7 @@ def register_discovery_tools(mcp: FastMCP) -> None:
 
     @mcp.tool(
         tags={"health", "package", "availability", "elicitation"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
 
     async def service_availability_elicitation(
@@ -615,17 +349,13 @@ def register_discovery_tools(mcp: FastMCP) -> None:
         Returns: Interactive selector showing available dates and time slots.
         """
         meta = ctx.request_context.meta
-        await ctx.info(f"[service_availability_elicitation] suggested_service_ids: {suggested_service_ids}, service_id: {service_id}, hospital_id: {hospital_id}, date: {preferred_date}, slot: {preferred_slot_time}, meta: {meta}")
+        logger.debug(
+            "[service_availability_elicitation] suggested_service_ids: %s, service_id: %s, hospital_id: %s, date: %s, slot: %s, meta: %s",
+            suggested_service_ids, service_id, hospital_id, preferred_date, preferred_slot_time, meta
+        )
         
         try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            doctor_clinic_service = DoctorClinicService(client)
+            doctor_clinic_service = _make_service()
             
             # Delegate to client - all orchestration logic is in the client layer
             result = await doctor_clinic_service.service_availability_elicitation(
@@ -638,12 +368,12 @@ def register_discovery_tools(mcp: FastMCP) -> None:
                 meta=meta
             )
             
-            await ctx.info("[service_availability_elicitation] Completed\n")
+            logger.info("[service_availability_elicitation] Completed")
             
             return result
             
         except EkaAPIError as e:
-            await ctx.error(f"[service_availability_elicitation] Failed: {e.message}\n")
+            await ctx.error(f"[service_availability_elicitation] Failed: {e.message}")
             return {
                 "error": e.message,
                 "status_code": e.status_code,
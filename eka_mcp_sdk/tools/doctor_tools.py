@@ -1,4 +1,3 @@
-import logging
 from fastmcp import FastMCP
 
 # Import tool registration functions from modular files
@@ -8,8 +7,6 @@ from .doctor_clinic_tools import register_doctor_clinic_tools, register_discover
 from .prescription_tools import register_prescription_tools
 from .extra_tools import register_extra_tools
 
-logger = logging.getLogger(__name__)
-
 
 def register_doctor_tools(mcp: FastMCP) -> None:
     """Register Doctor Tools MCP tools from modular components."""
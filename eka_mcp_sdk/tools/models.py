@@ -1,14 +1,30 @@
 """Pydantic models for tool parameters and validation."""
 
-from datetime import datetime
-from typing import Optional, Literal
-from pydantic import BaseModel, Field, field_validator
+import time
+from datetime import date, datetime
+from typing import Optional, Literal, Tuple
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
 TIME_24H_PATTERN = r"^(?:[01]\d|2[0-3]):[0-5]\d$"
 MOBILE_NUMBER_WITH_COUNTRY_CODE = r"^\+91[6-9]\d{9}$"
 
+# (monotonic timestamp, local date) of the last date.today() lookup
+_today_cache: Optional[Tuple[float, date]] = None
+
+
+def _today() -> date:
+    """Local date, refreshed at most once per second for bulk validation."""
+    global _today_cache
+    now = time.monotonic()
+    if _today_cache is None or now - _today_cache[0] > 1.0:
+        _today_cache = (now, date.today())
+    return _today_cache[1]
+
+
 class PatientData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     fln: str = Field(
         ..., 
         description="Full legal name"
@@ -37,6 +53,9 @@ class PatientData(BaseModel):
 class AppointmentBookingRequest(BaseModel):
     """Appointment booking request model matching Eka Care API specification."""
     
+    # Built once per tool call and only read afterwards
+    model_config = ConfigDict(frozen=True)
+    
     patient_id: Optional[str] = Field(
         None,
         description="Patient's unique identifier (oid from patient lookup). Omit for registration and provide patient_name, dob, and gender.",
@@ -90,16 +109,24 @@ class AppointmentBookingRequest(BaseModel):
     @classmethod
     def validate_date_not_past(cls, v: str) -> str:
         """Validate that appointment date is not in the past."""
-        try:
-            appointment_date = datetime.strptime(v, "%Y-%m-%d").date()
-            today = datetime.now().date()
-            if appointment_date < today:
-                raise ValueError(f"Appointment date cannot be in the past. Provided: {v}, Today: {today}")
-            return v
-        except ValueError as e:
-            if "does not match format" in str(e):
-                raise ValueError(f"Invalid date format. Use YYYY-MM-DD. Provided: {v}")
-            raise
+        # Fast path for the canonical YYYY-MM-DD shape; strptime is slow
+        # and only needed for the looser forms it also accepts (2025-1-5).
+        # Impossible dates (2025-02-30) raise ValueError from date() as-is.
+        if (len(v) == 10 and v[4] == "-" and v[7] == "-" and v.isascii()
+                and v[:4].isdigit() and v[5:7].isdigit() and v[8:].isdigit()):
+            appointment_date = date(int(v[:4]), int(v[5:7]), int(v[8:]))
+        else:
+            try:
+                appointment_date = datetime.strptime(v, "%Y-%m-%d").date()
+            except ValueError as e:
+                if "does not match format" in str(e):
+                    raise ValueError(f"Invalid date format. Use YYYY-MM-DD. Provided: {v}")
+                raise
+        
+        today = _today()
+        if appointment_date < today:
+            raise ValueError(f"Appointment date cannot be in the past. Provided: {v}, Today: {today}")
+        return v
     
     @field_validator('end_time')
     @classmethod
@@ -2,37 +2,44 @@ from typing import Any, Dict, Optional, List, Annotated, Literal
 import logging
 from eka_mcp_sdk.tools.models import PatientData
 from fastmcp import FastMCP
-from fastmcp.server.dependencies import get_access_token, AccessToken
 from fastmcp.dependencies import CurrentContext
 from fastmcp.server.context import Context
-from ..utils.fastmcp_helper import readonly_tool_annotations, write_tool_annotations
+from ..utils.fastmcp_helper import readonly_tool_annotations, write_tool_annotations, eka_tool_handler, normalize_id, normalize_mobile, ctx_debug, ctx_info
 from ..utils.deduplicator import get_deduplicator
-
-from ..utils.enrichment_helpers import (
-    get_cached_data,
-    extract_doctor_summary,
-    extract_clinic_summary,
-    get_appointment_status_info
-)
-from ..utils.workspace_utils import get_workspace_id
-from ..clients.client_factory import ClientFactory
+from ..utils.workspace_utils import get_request_client
 
 from ..clients.eka_emr_client import EkaEMRClient
 from ..auth.models import EkaAPIError
 from ..services.patient_service import PatientService
-from ..utils.tool_registration import get_extra_headers
 
 logger = logging.getLogger(__name__)
 
+_READONLY_ANNOTATIONS = readonly_tool_annotations()
+_WRITE_ANNOTATIONS = write_tool_annotations()
+_DESTRUCTIVE_ANNOTATIONS = write_tool_annotations(destructive=True)
+
+
+def _make_service() -> PatientService:
+    return PatientService(get_request_client())
+
+
+def _summarize_patients(result: Dict[str, Any]) -> str:
+    return f"{len(result['patients'])} patients"
+
+
+def _summarize_added_patient(result: Dict[str, Any]) -> str:
+    return f"patient ID: {result.get('oid')}"
+
 
 def register_patient_tools(mcp: FastMCP) -> None:
     """Register Patient Management MCP tools."""
     
     @mcp.tool(
         enabled=True,
-        annotations=readonly_tool_annotations(),
+        annotations=_READONLY_ANNOTATIONS,
         tags={"patient", "read", "search"}
     )
+    @eka_tool_handler("search_patients", summary=_summarize_patients)
     async def search_patients(
         prefix: Annotated[str, "Search prefix to match against patient profiles (username, mobile, or full name)"],
         limit: Annotated[Optional[int], "Maximum number of results to return (default: 50, max: 50)"] = None,
@@ -58,39 +65,15 @@ def register_patient_tools(mcp: FastMCP) -> None:
         Returns dict with success (bool) and data (dict) 
         
         """
-        await ctx.info(f"[search_patients] Searching patients with prefix: {prefix}")
-        await ctx.debug(f"Search parameters - limit: {limit}, select: {select}")
-        
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            patient_service = PatientService(client)
-            result = await patient_service.search_patients(prefix, limit, select)
-            
-            patient_count = len(result.get('patients', [])) if isinstance(result, dict) else 0
-            await ctx.info(f"[search_patients] Found {patient_count} patients matching search criteria\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[search_patients] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        await ctx_info(ctx, lambda: f"[search_patients] Searching patients with prefix: {prefix}")
+        await ctx_debug(ctx, lambda: f"Search parameters - limit: {limit}, select: {select}")
+        return await _make_service().search_patients(prefix, limit, select)
     
     @mcp.tool(
         tags={"patient", "read", "basic", "profile"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_patient_details_basic")
     async def get_patient_details_basic(
         patient_id: Annotated[Optional[str], "Patient's unique identifier"] = None,
         ctx: Context = CurrentContext()
@@ -112,37 +95,16 @@ def register_patient_tools(mcp: FastMCP) -> None:
         -data: Patient profile details
 
         """
-        await ctx.info(f"[get_patient_details_basic] Getting basic patient details for: {patient_id}")
-        
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            patient_service = PatientService(client)
-            result = await patient_service.get_patient_details_basic(patient_id)
-            
-            await ctx.info(f"[get_patient_details_basic] Completed successfully\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[get_patient_details_basic] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        if patient_id is not None:
+            patient_id = normalize_id(patient_id, "patient_id")
+        await ctx_info(ctx, lambda: f"[get_patient_details_basic] Getting basic patient details for: {patient_id}")
+        return await _make_service().get_patient_details_basic(patient_id)
     
     @mcp.tool(
         tags={"patient", "read", "appointments"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_comprehensive_patient_profile")
     async def get_comprehensive_patient_profile(
         patient_id: Annotated[str, "Patient ID (oid from list/mobile lookup)"],
         include_appointments: Annotated[bool, "Include appointments (default: True)"] = True,
@@ -164,40 +126,18 @@ def register_patient_tools(mcp: FastMCP) -> None:
         Returns:
             Complete patient profile with enriched appointment history including doctor and clinic details
         """
-        await ctx.info(f"[get_comprehensive_patient_profile] Getting comprehensive profile for patient: {patient_id}")
-        await ctx.debug(f"Include appointments: {include_appointments}, limit: {appointment_limit}")
-        
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            patient_service = PatientService(client)
-            result = await patient_service.get_comprehensive_patient_profile(
-                patient_id, include_appointments, appointment_limit
-            )
-            
-            await ctx.info(f"[get_comprehensive_patient_profile] Completed successfully\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[get_comprehensive_patient_profile] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        patient_id = normalize_id(patient_id, "patient_id")
+        await ctx_info(ctx, lambda: f"[get_comprehensive_patient_profile] Getting comprehensive profile for patient: {patient_id}")
+        await ctx_debug(ctx, lambda: f"Include appointments: {include_appointments}, limit: {appointment_limit}")
+        return await _make_service().get_comprehensive_patient_profile(
+            patient_id, include_appointments, appointment_limit
+        )
     
     @mcp.tool(
-    tags={"patient", "write"},
-    annotations=write_tool_annotations()
-)
+        tags={"patient", "write"},
+        annotations=_WRITE_ANNOTATIONS
+    )
+    @eka_tool_handler("add_patient", summary=_summarize_added_patient)
     async def add_patient(
         patient_data: PatientData,
         ctx: Context = CurrentContext()
@@ -226,48 +166,25 @@ def register_patient_tools(mcp: FastMCP) -> None:
 
         # Check for duplicate request (ChatGPT multiple clients issue)
         dedup = get_deduplicator()
-        is_duplicate, cached_response = dedup.check_and_get_cached("add_patient", **patient_dict)  
+        is_duplicate, cached_result = dedup.check_and_get_cached("add_patient", **patient_dict)  
         
-        if is_duplicate and cached_response:
-            await ctx.info("⚡ DUPLICATE REQUEST - Returning cached patient response")
-            return cached_response
+        if is_duplicate and cached_result is not None:
+            await ctx_info(ctx, lambda: "⚡ DUPLICATE REQUEST - Returning cached patient response")
+            return cached_result
         
-        await ctx.info(f"[add_patient] Creating new patient profile")
-        await ctx.debug(f"Patient data keys: {list(patient_dict.keys())}")  
+        await ctx_info(ctx, lambda: f"[add_patient] Creating new patient profile")
+        await ctx_debug(ctx, lambda: f"Patient data keys: {list(patient_dict.keys())}")  
         
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            patient_service = PatientService(client)
-            result = await patient_service.add_patient(patient_dict)  
-            
-            patient_id = result.get('oid') if isinstance(result, dict) else None
-            await ctx.info(f"[add_patient] Completed successfully - patient ID: {patient_id}\n")
-            
-            response = {"success": True, "data": result}
-            # Cache the successful response
-            dedup.cache_response("add_patient", response, **patient_dict)  
-            return response
-        except EkaAPIError as e:
-            await ctx.error(f"[add_patient] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        result = await _make_service().add_patient(patient_dict)
+        # Cache the successful result; failures raise and are never cached
+        dedup.cache_response("add_patient", result, **patient_dict)  
+        return result
     
     @mcp.tool(
         tags={"patient", "read", "list", "browse"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("list_patients", summary=_summarize_patients)
     async def list_patients(
         page_no: Annotated[int, "Page number (starts from 0)"],
         page_size: Annotated[Optional[int], "Records per page (default: 500, max: 2000)"] = None,
@@ -296,38 +213,14 @@ def register_patient_tools(mcp: FastMCP) -> None:
         
         Returns: List with oid (patient_id), fln (full legal name), mobile, dob, gen (gender)
         """
-        await ctx.info(f"[list_patients] Listing patients - page {page_no}, size: {page_size or 'default'}")
-        
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            patient_service = PatientService(client)
-            result = await patient_service.list_patients(page_no, page_size, select, from_timestamp, include_archived)
-            
-            patient_count = len(result.get('patients', [])) if isinstance(result, dict) else 0
-            await ctx.info(f"[list_patients] Completed successfully - retrieved {patient_count} patients\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[list_patients] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        await ctx_info(ctx, lambda: f"[list_patients] Listing patients - page {page_no}, size: {page_size or 'default'}")
+        return await _make_service().list_patients(page_no, page_size, select, from_timestamp, include_archived)
     
     @mcp.tool(
         tags={"patient", "write", "update"},
-        annotations=write_tool_annotations()
+        annotations=_WRITE_ANNOTATIONS
     )
+    @eka_tool_handler("update_patient")
     async def update_patient(
         update_data: Annotated[Dict[str, Any], "Dictionary of fields and values to update (e.g., name, mobile, dob)"],
         patient_id: Annotated[Optional[str], "Unique identifier of the patient to update"] = None,
@@ -346,37 +239,16 @@ def register_patient_tools(mcp: FastMCP) -> None:
         Returns:
             Success message confirming profile update
         """
-        await ctx.info(f"[update_patient] Updating patient {patient_id} - fields: {list(update_data.keys())}")
-        
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            patient_service = PatientService(client)
-            result = await patient_service.update_patient(patient_id, update_data)
-            
-            await ctx.info(f"[update_patient] Completed successfully\n")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[update_patient] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        if patient_id is not None:
+            patient_id = normalize_id(patient_id, "patient_id")
+        await ctx_info(ctx, lambda: f"[update_patient] Updating patient {patient_id} - fields: {list(update_data.keys())}")
+        return await _make_service().update_patient(patient_id, update_data)
     
     @mcp.tool(
         tags={"patient", "write", "archive", "destructive"},
-        annotations=write_tool_annotations(destructive=True)
+        annotations=_DESTRUCTIVE_ANNOTATIONS
     )
+    @eka_tool_handler("archive_patient")
     async def archive_patient(
         patient_id: Annotated[str, "Unique identifier of the patient to archive"],
     ) -> Dict[str, Any]:
@@ -393,31 +265,14 @@ def register_patient_tools(mcp: FastMCP) -> None:
         Returns:
             Success message confirming profile removal
         """
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            patient_service = PatientService(client)
-            result = await patient_service.archive_patient(patient_id)
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        patient_id = normalize_id(patient_id, "patient_id")
+        return await _make_service().archive_patient(patient_id)
     
     @mcp.tool(
         tags={"patient", "read", "search", "mobile"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_patient_by_mobile")
     async def get_patient_by_mobile(
         mobile: Annotated[str, "Mobile with country code: +91XXXXXXXXX"],
         full_profile: Annotated[bool, "Return full profile if True (default: False)"] = False,
@@ -443,31 +298,14 @@ def register_patient_tools(mcp: FastMCP) -> None:
         
         Returns: Patient with oid (patient_id)
         """
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            patient_service = PatientService(client)
-            result = await patient_service.get_patient_by_mobile(mobile, full_profile)
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        mobile = normalize_mobile(mobile)
+        return await _make_service().get_patient_by_mobile(mobile, full_profile)
 
     @mcp.tool(
         tags={"patient", "auth", "otp", "verification"},
-        annotations=write_tool_annotations()
+        annotations=_WRITE_ANNOTATIONS
     )
+    @eka_tool_handler("mobile_number_verification")
     async def mobile_number_verification(
         mobile_number: Annotated[str, "Mobile number to verify (10 digits without country code)"],
         otp: Annotated[Optional[str], "One-Time Password sent to the mobile number"] = None,
@@ -489,47 +327,18 @@ def register_patient_tools(mcp: FastMCP) -> None:
         Returns: Response indicating OTP sent/verification status
         """
         stage_display = "Sending OTP" if stage == "send_otp" else "Verifying OTP"
-        await ctx.info(f"[mobile_number_verification] {stage_display} for: {mobile_number}")
+        await ctx_info(ctx, lambda: f"[mobile_number_verification] {stage_display} for: {mobile_number}")
         
         # Validate OTP is provided for verify stage
         if stage == "verify_otp" and not otp:
-            return {
-                "success": False,
-                "error": {
-                    "message": "OTP is required for verify_otp stage",
-                    "error_code": "MISSING_OTP"
-                }
-            }
+            raise EkaAPIError("OTP is required for verify_otp stage", error_code="MISSING_OTP")
         
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            patient_service = PatientService(client)
-            result = await patient_service.mobile_number_verification(mobile_number, otp, stage)
-            
-            success_msg = "OTP sent successfully" if stage == "send_otp" else "Verification completed"
-            await ctx.info(f"[mobile_number_verification] {success_msg}\n")
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[mobile_number_verification] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        return await _make_service().mobile_number_verification(mobile_number, otp, stage)
 
 
     @mcp.tool(
         tags={"patient", "auth", "authentication", "authorization"},
-        annotations=write_tool_annotations()
+        annotations=_WRITE_ANNOTATIONS
     )
     async def authentication_elicitation(
         method: Annotated[Literal["mobile", "email"], "Authentication method to use"] = "mobile",
@@ -543,33 +352,20 @@ def register_patient_tools(mcp: FastMCP) -> None:
         Use this tool for authenticating a user.
         """
         meta = ctx.request_context.meta
-        await ctx.info(f"[authentication_elicitation] Initiating {method} authentication for mobile: {mobile_number}, email: {email_address}")
+        await ctx_info(ctx, lambda: f"[authentication_elicitation] Initiating {method} authentication for mobile: {mobile_number}, email: {email_address}")
 
         try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            patient_service = PatientService(client)
+            patient_service = _make_service()
             return await patient_service.authentication_elicitation(method, mobile_number, email_address, meta)
         except EkaAPIError as e:
             await ctx.error(f"[authentication_elicitation] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+            return e.to_response()
 
     @mcp.tool(
         tags={"patient", "profile", "list"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("list_all_patient_profiles")
     async def list_all_patient_profiles(
         ctx: Context = CurrentContext()
     ) -> Dict[str, Any]:
@@ -580,36 +376,14 @@ def register_patient_tools(mcp: FastMCP) -> None:
         
         Returns: List of all patient profiles with their details
         """
-        await ctx.info("[list_all_patient_profiles] Fetching all patient profiles")
-        
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            patient_service = PatientService(client)
-            result = await patient_service.list_all_patient_profiles()
-            
-            await ctx.info(f"[list_all_patient_profiles] Retrieved patient profiles\n")
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[list_all_patient_profiles] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        await ctx_info(ctx, lambda: "[list_all_patient_profiles] Fetching all patient profiles")
+        return await _make_service().list_all_patient_profiles()
 
     @mcp.tool(
         tags={"patient", "vitals", "health"},
-        annotations=readonly_tool_annotations()
+        annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_patient_vitals")
     async def get_patient_vitals(
         patient_id: Annotated[Optional[str], "Patient's unique identifier (oid)"] = None,
         ctx: Context = CurrentContext()
@@ -624,35 +398,15 @@ def register_patient_tools(mcp: FastMCP) -> None:
         
         Returns: Patient vitals data including health metrics
         """
-        await ctx.info(f"[get_patient_vitals] Fetching vitals for patient: {patient_id}")
-        
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            patient_service = PatientService(client)
-            result = await patient_service.get_patient_vitals(patient_id)
-            
-            await ctx.info(f"[get_patient_vitals] Retrieved vitals successfully\n")
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[get_patient_vitals] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        if patient_id is not None:
+            patient_id = normalize_id(patient_id, "patient_id")
+        await ctx_info(ctx, lambda: f"[get_patient_vitals] Fetching vitals for patient: {patient_id}")
+        return await _make_service().get_patient_vitals(patient_id)
 
     @mcp.tool(
-        tags={"patient", "benefits", "offers"}, annotations=readonly_tool_annotations()
+        tags={"patient", "benefits", "offers"}, annotations=_READONLY_ANNOTATIONS
     )
+    @eka_tool_handler("get_patient_benefits")
     async def get_patient_benefits(ctx: Context = CurrentContext()) -> Dict[str, Any]:
         """
         Retrieve available offers and benefits for a specific patient.
@@ -661,33 +415,8 @@ def register_patient_tools(mcp: FastMCP) -> None:
 
         Returns: list of offers and benefits specific to the patients.
         """
-        await ctx.info("[get_patient_benefits] Fetching benefits for patient")
-
-        try:
-            token: AccessToken | None = get_access_token()
-            access_token = token.token if token else None
-            workspace_id = get_workspace_id()
-            custom_headers = get_extra_headers()
-            client = ClientFactory.create_client(
-                workspace_id, access_token, custom_headers
-            )
-            patient_service = PatientService(client)
-            result = await patient_service.get_patient_benefits()
-
-            await ctx.info(
-                "[get_patient_benefits] Retrieved patient benefits successfully\n"
-            )
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"[get_patient_benefits] Failed: {e.message}\n")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code,
-                },
-            }
+        await ctx_info(ctx, lambda: "[get_patient_benefits] Fetching benefits for patient")
+        return await _make_service().get_patient_benefits()
 
 
 # This function is now handled by the PatientService class
@@ -703,65 +432,4 @@ async def _enrich_patient_appointments(client: EkaEMRClient, appointments_data:
     Returns:
         List of enriched appointments with doctor and clinic information
     """
-    try:
-        # Handle different response structures
-        appointments_list = []
-        if isinstance(appointments_data, list):
-            appointments_list = appointments_data
-        elif isinstance(appointments_data, dict):
-            if "appointments" in appointments_data:
-                appointments_list = appointments_data.get("appointments", [])
-            elif "data" in appointments_data:
-                appointments_list = appointments_data.get("data", [])
-            else:
-                appointments_list = [appointments_data] if appointments_data.get("appointment_id") else []
-        
-        if not appointments_list:
-            return []
-        
-        enriched_appointments = []
-        
-        # Cache for avoiding duplicate API calls
-        doctors_cache = {}
-        clinics_cache = {}
-        
-        for appointment in appointments_list:
-            enriched_appointment = appointment.copy()
-            
-            # Enrich with doctor details
-            doctor_id = appointment.get("doctor_id")
-            if doctor_id:
-                doctor_info = await get_cached_data(
-                    client.get_doctor_profile, doctor_id, doctors_cache
-                )
-                if doctor_info:
-                    enriched_appointment["doctor_details"] = extract_doctor_summary(doctor_info)
-            
-            # Enrich with clinic details
-            clinic_id = appointment.get("clinic_id")
-            if clinic_id:
-                clinic_info = await get_cached_data(
-                    client.get_clinic_details, clinic_id, clinics_cache
-                )
-                if clinic_info:
-                    enriched_appointment["clinic_details"] = extract_clinic_summary(clinic_info)
-            
-            # Add appointment status context
-            status = appointment.get("status", "")
-            enriched_appointment["status_info"] = get_appointment_status_info(status)
-            
-            enriched_appointments.append(enriched_appointment)
-        
-        return enriched_appointments
-        
-    except Exception as e:
-        logger.warning(f"Failed to enrich patient appointments: {str(e)}")
-        # Return original data if enrichment fails
-        if isinstance(appointments_data, list):
-            return appointments_data
-        elif isinstance(appointments_data, dict) and "appointments" in appointments_data:
-            return appointments_data.get("appointments", [])
-        else:
-            return []
-
-
+    return await PatientService(client)._enrich_patient_appointments(appointments_data)
@@ -1,24 +1,33 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 import logging
 from fastmcp import FastMCP
 from fastmcp.server.dependencies import get_access_token, AccessToken
 from fastmcp.dependencies import CurrentContext
 from fastmcp.server.context import Context
 
+from ..clients.client_factory import ClientFactory
 from ..clients.eka_emr_client import EkaEMRClient
-from ..auth.models import EkaAPIError
 from ..services.prescription_service import PrescriptionService
-from ..utils.tool_registration import get_extra_headers
+from ..utils.fastmcp_helper import ctx_debug, ctx_info, eka_tool_handler
+from ..utils.tool_registration import disabled_tool, get_extra_headers
 
 logger = logging.getLogger(__name__)
 
 
+def _make_service() -> PrescriptionService:
+    token: AccessToken | None = get_access_token()
+    return PrescriptionService(ClientFactory.get_client(
+        "ekaemr", token.token if token else None, get_extra_headers(), EkaEMRClient
+    ))
+
+
 def register_prescription_tools(mcp: FastMCP) -> None:
     """Register Prescription Management MCP tools."""
     
-    @mcp.tool(
-        enabled=False,
+    @disabled_tool(
+        mcp,
     )
+    @eka_tool_handler("get_prescription_details_basic")
     async def get_prescription_details_basic(
         prescription_id: str,
         ctx: Context = CurrentContext()
@@ -35,31 +44,14 @@ def register_prescription_tools(mcp: FastMCP) -> None:
         Returns:
             Basic prescription details including medications and diagnosis only
         """
-        await ctx.info(f"Getting basic prescription details for: {prescription_id}")
+        await ctx_info(ctx, lambda: f"Getting basic prescription details for: {prescription_id}")
         
-        try:
-            token: AccessToken | None = get_access_token()
-            client = EkaEMRClient(access_token=token.token if token else None, custom_headers=get_extra_headers())
-            prescription_service = PrescriptionService(client)
-            result = await prescription_service.get_prescription_details_basic(prescription_id)
-            
-            await ctx.info("Retrieved basic prescription details successfully")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"Failed to get prescription details: {e.message}")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        return await _make_service().get_prescription_details_basic(prescription_id)
     
-    @mcp.tool(
-        enabled=False,
+    @disabled_tool(
+        mcp,
     )
+    @eka_tool_handler("get_comprehensive_prescription_details")
     async def get_comprehensive_prescription_details(
         prescription_id: str,
         include_patient_details: bool = True,
@@ -83,29 +75,11 @@ def register_prescription_tools(mcp: FastMCP) -> None:
         Returns:
             Complete prescription details with enriched patient, doctor, and clinic information
         """
-        await ctx.info(f"Getting comprehensive prescription details for: {prescription_id}")
-        await ctx.debug(f"Include patient: {include_patient_details}, doctor: {include_doctor_details}, clinic: {include_clinic_details}")
+        await ctx_info(ctx, lambda: f"Getting comprehensive prescription details for: {prescription_id}")
+        await ctx_debug(ctx, lambda: f"Include patient: {include_patient_details}, doctor: {include_doctor_details}, clinic: {include_clinic_details}")
         
-        try:
-            token: AccessToken | None = get_access_token()
-            client = EkaEMRClient(access_token=token.token if token else None, custom_headers=get_extra_headers())
-            prescription_service = PrescriptionService(client)
-            result = await prescription_service.get_comprehensive_prescription_details(
-                prescription_id, include_patient_details, include_doctor_details, include_clinic_details
-            )
-            
-            await ctx.info("Retrieved comprehensive prescription details successfully")
-            
-            return {"success": True, "data": result}
-        except EkaAPIError as e:
-            await ctx.error(f"Failed to get comprehensive prescription: {e.message}")
-            return {
-                "success": False,
-                "error": {
-                    "message": e.message,
-                    "status_code": e.status_code,
-                    "error_code": e.error_code
-                }
-            }
+        return await _make_service().get_comprehensive_prescription_details(
+            prescription_id, include_patient_details, include_doctor_details, include_clinic_details
+        )
 
 
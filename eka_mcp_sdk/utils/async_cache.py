@@ -0,0 +1,201 @@
+"""Process-level async TTL cache shared across MCP tool invocations."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTTLCache:
+    """
+    LRU cache with per-entry expiry for async lookups.
+
+    Entity profiles (patients, doctors) are rarely altered, yet every
+    enrichment call used to re-fetch them through a per-call dict. This cache
+    lives for the lifetime of the server process so repeat lookups across
+    tool invocations are served from memory.
+
+    Concurrent misses on the same key share one in-flight task
+    (single-flight), so only one upstream call is made and its result or
+    error reaches every waiter at once. Failed computations are never cached.
+
+    Invalidation drops entries directly: ``bump(tag)`` removes every entry
+    stored under that tag (for example every scoped key of one patient) and
+    ``bump()`` removes all of them. Computations still in flight for those
+    keys are detached, so their results are not stored and a read issued
+    after the bump never joins an older fetch. No per-tag state outlives the
+    entries, so memory stays bounded by ``maxsize``.
+
+    With ``ttl=0`` nothing is stored and the cache only coalesces identical
+    concurrent computations.
+    """
+
+    def __init__(self, maxsize: int = 2048, ttl: float = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before least-recently-used eviction
+            ttl: Time-to-live of each entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Hashable, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, Tuple[Hashable, "asyncio.Future[Any]"]] = {}
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (hit, value) for key, dropping the entry if it has expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return False, None
+        expires_at, _, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return False, None
+        self._data.move_to_end(key)
+        return True, value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value without computing it on a miss."""
+        hit, value = self._lookup(key)
+        return value if hit else default
+
+    def set(self, key: Hashable, value: Any, tag: Hashable = None) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if self.ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, tag, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        coro_factory: Callable[[], Awaitable[Any]],
+        tag: Hashable = None
+    ) -> Any:
+        """
+        Return the cached value for key, computing it on a miss.
+
+        Args:
+            key: Cache key
+            coro_factory: Zero-argument callable returning the awaitable to run on a miss
+            tag: Invalidation tag (e.g. the entity id) shared by related keys
+
+        Returns:
+            Cached or freshly computed value
+
+        Raises:
+            Whatever the computation raises; errors are not cached
+        """
+        hit, value = self._lookup(key)
+        if hit:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            task = inflight[1]
+        else:
+            task = asyncio.ensure_future(self._fill(key, coro_factory, tag))
+            self._inflight[key] = (tag, task)
+            task.add_done_callback(lambda done: self._finish(key, done))
+        # Shielded so one cancelled caller doesn't abort the fetch others share
+        return await asyncio.shield(task)
+
+    async def _fill(
+        self,
+        key: Hashable,
+        coro_factory: Callable[[], Awaitable[Any]],
+        tag: Hashable
+    ) -> Any:
+        """Run the computation for a miss and store its result."""
+        value = await coro_factory()
+        # A bump during the fetch detaches this task; its value is then stale
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight[1] is asyncio.current_task():
+            self.set(key, value, tag)
+        return value
+
+    def _finish(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        """Forget a completed in-flight task."""
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight[1] is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Waiters re-raise the error; mark it retrieved in case none are left
+            task.exception()
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry (e.g. after the entity was mutated)."""
+        self._data.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def bump(self, tag: Hashable = None) -> None:
+        """
+        Invalidate every entry stored under tag, or all entries without one.
+
+        In-flight computations for the affected keys are detached as well,
+        so later reads start a fresh fetch instead of joining a stale one.
+        """
+        if tag is None:
+            self._data.clear()
+            self._inflight.clear()
+            return
+        for key in [key for key, entry in self._data.items() if entry[1] == tag]:
+            del self._data[key]
+        for key in [key for key, inflight in self._inflight.items() if inflight[0] == tag]:
+            del self._inflight[key]
+
+    def clear(self) -> None:
+        """Drop every entry (useful for testing)."""
+        self.bump()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def caller_identity(client: Any) -> Tuple[Any, ...]:
+    """
+    Identity of the caller a client acts for.
+
+    Matches what ClientFactory keys its clients on: the access token, the
+    forwarded x-eka-* headers (which carry the workspace and JWT payload) and
+    the client class, so two callers only share entries when they would also
+    share a client.
+    """
+    headers = getattr(client, "_custom_headers", None) or {}
+    return (getattr(client, "access_token", None), tuple(sorted(headers.items())), type(client))
+
+
+def scoped_key(client: Any, entity_id: str) -> Tuple[Any, ...]:
+    """
+    Build a cache key scoped to the caller's identity.
+
+    Entries are keyed by the caller (see caller_identity) as well as the
+    entity id so data fetched for one workspace/user is never served to
+    another.
+    """
+    return (caller_identity(client), entity_id)
+
+
+# Global singleton instances (one per server process). They hold the
+# enrichment summaries rather than full profiles to keep entries small.
+patient_summary_cache = AsyncTTLCache(maxsize=2048, ttl=300)
+doctor_summary_cache = AsyncTTLCache(maxsize=2048, ttl=300)
+clinic_summary_cache = AsyncTTLCache(maxsize=1024, ttl=300)
+
+# Workspace-wide doctor/clinic listing; changes rarely but is fetched by most
+# booking flows, so even a short TTL removes most repeat calls
+business_entities_cache = AsyncTTLCache(maxsize=256, ttl=60)
+
+# Last ETag and parsed body per caller, kept well past the TTL above so an
+# expired listing can be revalidated with If-None-Match instead of re-sent
+business_entities_validators = AsyncTTLCache(maxsize=256, ttl=3600)
+
+# Full patient reads are never cached (they must reflect the latest update),
+# but identical concurrent reads from the same caller share one request
+patient_read_coalescer = AsyncTTLCache(maxsize=1024, ttl=0)
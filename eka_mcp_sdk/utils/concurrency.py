@@ -0,0 +1,82 @@
+"""Helpers for running independent API calls concurrently."""
+
+import asyncio
+import inspect
+from typing import Any, Awaitable, Iterable, List
+
+# Max in-flight upstream requests per enrichment fan-out
+FANOUT_LIMIT = 16
+
+
+async def run_concurrently(*aws: Awaitable[Any]) -> List[Any]:
+    """
+    Run awaitables concurrently with structured cancellation.
+
+    Results are returned in argument order. If any awaitable raises, the
+    remaining ones are cancelled and the original exception is re-raised
+    as-is (not wrapped in an ExceptionGroup), so callers can keep catching
+    EkaAPIError.
+
+    Uses asyncio.TaskGroup where available (Python 3.11+) and an equivalent
+    asyncio.wait(FIRST_EXCEPTION) fallback on Python 3.10.
+    """
+    if not aws:
+        return []
+
+    if hasattr(asyncio, "TaskGroup"):
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(aw) for aw in aws]
+        except BaseExceptionGroup as eg:  # noqa: F821 - builtin on 3.11+
+            raise eg.exceptions[0]
+        return [task.result() for task in tasks]
+
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    for task in done:
+        if not task.cancelled() and task.exception() is not None:
+            for other in pending:
+                other.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise task.exception()
+    return [task.result() for task in tasks]
+
+
+async def bounded_gather(
+    aws: Iterable[Awaitable[Any]],
+    limit: int = FANOUT_LIMIT,
+    return_exceptions: bool = False
+) -> List[Any]:
+    """
+    Like asyncio.gather, but with at most ``limit`` awaitables running at once.
+
+    Fan-outs over workspace-sized lists (clinics of a doctor, doctors of a
+    clinic, patients of an appointment page) would otherwise fire every
+    request at the same time and stampede the API and the connection pool.
+
+    Args:
+        aws: Awaitables to run; results are returned in the same order
+        limit: Maximum number running concurrently
+        return_exceptions: Passed through to asyncio.gather
+    """
+    aws = list(aws)
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    try:
+        return await asyncio.gather(*(bounded(aw) for aw in aws), return_exceptions=return_exceptions)
+    except BaseException:
+        # Cancelled before every coroutine got a slot: close the ones that
+        # never started so they aren't reported as "never awaited"
+        for aw in aws:
+            if inspect.iscoroutine(aw) and inspect.getcoroutinestate(aw) == inspect.CORO_CREATED:
+                aw.close()
+        raise
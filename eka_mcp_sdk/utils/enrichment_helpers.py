@@ -5,10 +5,13 @@ This module contains common helper functions used for enriching API responses
 with additional data from related entities, caching mechanisms, and data transformations.
 """
 
-from typing import Any, Dict, Optional, Callable, Awaitable
+from typing import Any, Dict, Iterable, Optional, Callable, Awaitable
 import logging
 from datetime import datetime
 
+from .async_cache import AsyncTTLCache, scoped_key
+from .concurrency import bounded_gather
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,12 +36,106 @@ async def get_cached_data(
             data = await api_function(entity_id)
             cache[entity_id] = data
         except Exception as e:
-            logger.warning(f"Failed to get data for {entity_id}: {str(e)}")
+            logger.warning("Failed to get data for %s: %s", entity_id, e)
             cache[entity_id] = None
     
     return cache.get(entity_id)
 
 
+async def get_shared_cached_data(
+    client: Any,
+    api_function: Callable[[str], Awaitable[Dict[str, Any]]],
+    entity_id: str,
+    cache: AsyncTTLCache,
+    transform: Optional[Callable[[Dict[str, Any]], Any]] = None
+) -> Optional[Any]:
+    """
+    Get data from a process-level TTL cache or API call.
+    
+    Unlike get_cached_data, entries survive across tool invocations. Keys are
+    scoped to the caller's identity (see scoped_key) and tagged with entity_id, so
+    cache.bump(entity_id) invalidates the entity for every caller.
+    
+    Args:
+        client: Client instance the lookup is made on behalf of
+        api_function: Async function that takes entity_id and returns data
+        entity_id: Unique identifier for the entity
+        cache: Shared AsyncTTLCache instance
+        transform: Optional function applied to the API response before it is
+            cached (e.g. extract_patient_summary), so only the result is kept
+    
+    Returns:
+        Entity data (or its transform) from cache or API, None if fetch fails
+    """
+    async def fetch() -> Any:
+        data = await api_function(entity_id)
+        return transform(data) if transform else data
+    
+    try:
+        return await cache.get_or_compute(scoped_key(client, entity_id), fetch, tag=entity_id)
+    except Exception as e:
+        logger.warning("Failed to get data for %s: %s", entity_id, e)
+        return None
+
+
+async def prefetch_shared_data(
+    client: Any,
+    api_function: Callable[[str], Awaitable[Dict[str, Any]]],
+    entity_ids: Iterable[Optional[str]],
+    cache: AsyncTTLCache,
+    transform: Optional[Callable[[Dict[str, Any]], Any]] = None
+) -> Dict[str, Any]:
+    """
+    Fetch many entities concurrently through get_shared_cached_data.
+    
+    Falsy and duplicate ids are skipped, so each unique entity costs at most
+    one API call, and the caller can then enrich rows with plain dict lookups.
+    
+    Args:
+        client: Client instance the lookups are made on behalf of
+        api_function: Async function that takes entity_id and returns data
+        entity_ids: Entity ids to fetch (may contain duplicates or None)
+        cache: Shared AsyncTTLCache instance
+        transform: Optional function applied to each API response before caching
+    
+    Returns:
+        Mapping of entity_id to its data; ids whose fetch failed are omitted
+    """
+    unique_ids = [entity_id for entity_id in dict.fromkeys(entity_ids) if entity_id]
+    if not unique_ids:
+        return {}
+    results = await bounded_gather(
+        get_shared_cached_data(client, api_function, entity_id, cache, transform)
+        for entity_id in unique_ids
+    )
+    return {
+        entity_id: data
+        for entity_id, data in zip(unique_ids, results)
+        if data is not None
+    }
+
+
+def copy_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a cached summary before placing it in a response row.
+    
+    Summaries live in process-wide caches, so rows must not share them:
+    a caller editing row["doctor_details"] would otherwise change the cached
+    entry seen by later calls. Nested dicts and lists (contact, location)
+    are copied one level down, which is as deep as summaries go.
+    
+    Args:
+        summary: Summary dict as stored in the cache
+    
+    Returns:
+        An independent copy of the summary
+    """
+    return {
+        key: value.copy() if isinstance(value, (dict, list)) else value
+        for key, value in summary.items()
+    }
+
+
 def calculate_age_from_dob(dob: str) -> Optional[int]:
     """
     Calculate age from date of birth string.
@@ -129,6 +226,11 @@ def extract_clinic_summary(clinic_info: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+_UPCOMING_STATUSES = frozenset({"scheduled", "confirmed", "booked"})
+_COMPLETED_STATUSES = frozenset({"completed", "done"})
+_CANCELLED_STATUSES = frozenset({"cancelled", "canceled"})
+
+
 def get_appointment_status_info(status: str) -> Dict[str, Any]:
     """
     Get enriched status information for an appointment.
@@ -139,9 +241,10 @@ def get_appointment_status_info(status: str) -> Dict[str, Any]:
     Returns:
         Dictionary with status flags and information
     """
+    normalized = status.lower()
     return {
         "status": status,
-        "is_upcoming": status.lower() in ["scheduled", "confirmed", "booked"],
-        "is_completed": status.lower() in ["completed", "done"],
-        "is_cancelled": status.lower() in ["cancelled", "canceled"]
+        "is_upcoming": normalized in _UPCOMING_STATUSES,
+        "is_completed": normalized in _COMPLETED_STATUSES,
+        "is_cancelled": normalized in _CANCELLED_STATUSES
     }
\ No newline at end of file
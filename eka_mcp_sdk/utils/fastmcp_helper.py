@@ -5,10 +5,105 @@ According to FastMCP documentation, when readOnlyHint=True, destructiveHint
 is automatically False and doesn't need explicit setting.
 """
 
+import logging
+import re
+import sys
 from functools import wraps
-from typing import Callable, Any, Dict
+from typing import Callable, Any, Dict, Optional
+import pydantic_core
 from mcp.types import ToolAnnotations
 
+from ..auth.models import EkaAPIError
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# orjson encodes tool results about twice as fast as FastMCP's default
+# pydantic_core serializer; optional (pip install "eka-mcp-sdk[fastjson]")
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Eka entity IDs are opaque tokens (UUIDs, hex object ids, prefixed numeric
+# ids); anything outside this alphabet cannot be a valid path segment
+_ID_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+# E.164: "+", country code and subscriber number, at most 15 digits
+_MOBILE_RE = re.compile(r"^\+\d{6,15}$")
+
+
+def normalize_id(value: str, field: str) -> str:
+    """Validate and intern an entity ID once at the tool boundary.
+    
+    Rejects malformed IDs before any network I/O and interns the rest so the
+    repeated dict lookups during enrichment compare by identity.
+    
+    Raises:
+        EkaAPIError: If the ID is empty or contains unexpected characters
+    """
+    value = value.strip() if isinstance(value, str) else ""
+    if not _ID_RE.match(value):
+        raise EkaAPIError(f"Invalid {field}", status_code=400, error_code="INVALID_ID")
+    return sys.intern(value)
+
+
+def normalize_mobile(value: str) -> str:
+    """Validate a mobile number with country code at the tool boundary.
+    
+    Raises:
+        EkaAPIError: If the number is not in +<country code><number> form
+    """
+    value = value.strip() if isinstance(value, str) else ""
+    if not _MOBILE_RE.match(value):
+        raise EkaAPIError(
+            "Invalid mobile number, expected +<country_code><number>",
+            status_code=400,
+            error_code="INVALID_MOBILE"
+        )
+    return value
+
+
+async def ctx_debug(ctx: Any, message: Callable[[], str]) -> None:
+    """Send a debug log to the client only when EKA_LOG_LEVEL is DEBUG.
+    
+    ctx.debug always writes a notification to the client session, so debug
+    lines are built lazily and skipped entirely at the default log level.
+    
+    Usage:
+        await ctx_debug(ctx, lambda: f"Patient data keys: {list(data)}")
+    """
+    if settings.log_level.upper() == "DEBUG":
+        await ctx.debug(message())
+
+
+async def ctx_info(ctx: Any, message: Callable[[], str]) -> None:
+    """Send an info log to the client unless EKA_LOG_LEVEL is above INFO.
+    
+    Same as ctx_debug, for the progress lines tools emit around each
+    service call; setting EKA_LOG_LEVEL=WARNING skips them entirely.
+    
+    Usage:
+        await ctx_info(ctx, lambda: f"Fetching patient {patient_id}")
+    """
+    if settings.log_level.upper() in ("DEBUG", "INFO"):
+        await ctx.info(message())
+
+
+def tool_result_serializer(data: Any) -> str:
+    """Serialize a tool result to the JSON text content sent to the client.
+    
+    Uses orjson when installed and falls back to FastMCP's default
+    (pydantic_core with str() for unknown types) for anything orjson
+    cannot encode, such as pydantic models or non-string dict keys.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            pass
+    return pydantic_core.to_json(data, fallback=str).decode()
+
 
 def elicitation_response(func: Callable) -> Callable:
     """Decorator to mark a tool response as requiring elicitation.
@@ -33,6 +128,52 @@ def elicitation_response(func: Callable) -> Callable:
     return wrapper
 
 
+def eka_tool_handler(
+    name: str,
+    summary: Optional[Callable[[Any], str]] = None
+) -> Callable[[Callable], Callable]:
+    """Decorator wrapping a tool body in the standard success/error envelope.
+    
+    The decorated coroutine only returns the raw service result. The wrapper
+    returns {"success": True, "data": result} and converts EkaAPIError into
+    the standard error dict (reported to the client via ctx.error). Completion
+    is logged server-side only, and only when INFO is enabled.
+    
+    Usage:
+        @mcp.tool(...)
+        @eka_tool_handler("get_doctor_profile_basic")
+        async def get_doctor_profile_basic(doctor_id: str, ctx: Context = CurrentContext()):
+            return await _make_service().get_doctor_profile_basic(doctor_id)
+    
+    Args:
+        name: Tool name used as the log prefix
+        summary: Optional callable producing a completion detail from the result.
+            Only evaluated when INFO logging is enabled; it may assume the
+            service's response shape, a mismatch just drops the detail.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            try:
+                result = await func(*args, **kwargs)
+            except EkaAPIError as e:
+                ctx = kwargs.get("ctx")
+                if ctx is not None:
+                    await ctx.error(f"[{name}] Failed: {e.message}")
+                return e.to_response()
+            if logger.isEnabledFor(logging.INFO):
+                detail = ""
+                if summary is not None:
+                    try:
+                        detail = f" - {summary(result)}"
+                    except (KeyError, TypeError, AttributeError):
+                        pass
+                logger.info("[%s] Completed successfully%s", name, detail)
+            return {"success": True, "data": result}
+        return wrapper
+    return decorator
+
+
 def readonly_tool_annotations(*, open_world: bool = False) -> ToolAnnotations:
     """Create annotations for read-only tools.
     
@@ -5,10 +5,14 @@ This module provides utilities to ensure comprehensive tools are registered
 before basic tools, guiding LLMs to prefer the comprehensive versions.
 """
 
-from typing import Dict, List, Callable, Any
+from contextvars import ContextVar
+from typing import Dict, List, Callable, Any, Optional
 from fastmcp import FastMCP
 import logging
 from fastmcp.server.dependencies import get_http_headers
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+from ..config.settings import settings
 
 
 logger = logging.getLogger(__name__)
@@ -59,7 +63,29 @@ class ToolRegistrationHelper:
         logger.info(f"Successfully registered {total_tools} tools total")
 
 
-def get_extra_headers() -> Dict[str, str]:
+# x-eka-* headers of the tool call being served, set once by ExtraHeadersMiddleware
+_EXTRA_HEADERS_CTX: ContextVar[Optional[Dict[str, str]]] = ContextVar("eka_extra_headers", default=None)
+
+# Per-call scratch space (e.g. the resolved EMR client), reset by
+# ExtraHeadersMiddleware for every tool call and filled lazily
+_REQUEST_SCOPE_CTX: ContextVar[Optional[Dict[str, Any]]] = ContextVar("eka_request_scope", default=None)
+
+
+def disabled_tool(mcp: FastMCP, **tool_kwargs: Any) -> Callable[[Callable], Callable]:
+    """
+    Decorator for tools that ship disabled.
+
+    Building a tool's schema and annotations has a cost at startup and the
+    objects stay resident even while the tool is disabled, so such tools are
+    only registered (still disabled) when EKA_REGISTER_DISABLED_TOOLS is set.
+    Otherwise the function is returned as-is.
+    """
+    if settings.register_disabled_tools:
+        return mcp.tool(enabled=False, **tool_kwargs)
+    return lambda fn: fn
+
+
+def _parse_extra_headers() -> Dict[str, str]:
     headers = get_http_headers()
     extra_headers = {}
     for key, value in headers.items():
@@ -68,6 +94,42 @@ def get_extra_headers() -> Dict[str, str]:
     return extra_headers
 
 
+def get_extra_headers() -> Dict[str, str]:
+    """
+    Get the x-eka-* headers of the current request.
+    
+    Served from the per-call ContextVar when ExtraHeadersMiddleware is
+    installed, otherwise parsed from the HTTP headers on each call.
+    """
+    extra_headers = _EXTRA_HEADERS_CTX.get()
+    if extra_headers is None:
+        extra_headers = _parse_extra_headers()
+    return extra_headers
+
+
+def get_request_scope() -> Optional[Dict[str, Any]]:
+    """Per-call dict for values resolved once per tool call, None outside one."""
+    return _REQUEST_SCOPE_CTX.get()
+
+
+class ExtraHeadersMiddleware(Middleware):
+    """
+    Set up per-call request state once per tool call instead of once per lookup.
+    
+    Parses the x-eka-* headers and opens an empty request scope that helpers
+    like get_request_client fill on first use.
+    """
+    
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        headers_token = _EXTRA_HEADERS_CTX.set(_parse_extra_headers())
+        scope_token = _REQUEST_SCOPE_CTX.set({})
+        try:
+            return await call_next(context)
+        finally:
+            _REQUEST_SCOPE_CTX.reset(scope_token)
+            _EXTRA_HEADERS_CTX.reset(headers_token)
+
+
 def get_supports_elicitation() -> bool:
     """
     Read whether the client supports UI elicitation from request headers.
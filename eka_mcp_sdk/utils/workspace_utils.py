@@ -60,3 +60,31 @@ def get_workspace_info() -> dict:
         return json.loads(jwt_payload_str) if jwt_payload_str else {}
     except Exception:
         return {}
+
+
+def get_request_client():
+    """
+    Get the shared EMR client for the current MCP request.
+    
+    Resolves the workspace, access token and x-eka-* headers of the request
+    and returns the matching cached client from ClientFactory.get_client.
+    Within a tool call the result is kept in the request scope, so later
+    lookups in the same call skip the resolution.
+    """
+    from fastmcp.server.dependencies import get_access_token
+    from ..clients.client_factory import ClientFactory
+    from .tool_registration import get_extra_headers, get_request_scope
+    
+    scope = get_request_scope()
+    if scope is not None and "client" in scope:
+        return scope["client"]
+    
+    token = get_access_token()
+    client = ClientFactory.get_client(
+        get_workspace_id(),
+        token.token if token else None,
+        get_extra_headers()
+    )
+    if scope is not None:
+        scope["client"] = client
+    return client
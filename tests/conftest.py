@@ -0,0 +1,29 @@
+"""Shared fixtures for the unit tests."""
+
+import httpx
+import jwt
+import pytest
+
+from eka_mcp_sdk.clients.eka_emr_client import EkaEMRClient
+from eka_mcp_sdk.config.settings import settings
+
+# auth_headers decodes the token's payload, so it has to be JWT-shaped
+TEST_ACCESS_TOKEN = jwt.encode({"sub": "test"}, "test-secret", algorithm="HS256")
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    """
+    Build EkaEMRClients whose requests go to a handler instead of the network.
+    
+    The client carries a fixed access token, so it never logs in, even when
+    EKA_CLIENT_SECRET is set in the environment.
+    """
+    monkeypatch.setattr(settings, "client_id", "test-client")
+
+    def make(handler):
+        client = EkaEMRClient(access_token=TEST_ACCESS_TOKEN)
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    return make
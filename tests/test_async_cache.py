@@ -0,0 +1,148 @@
+"""Unit tests for the process-level AsyncTTLCache."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from eka_mcp_sdk.clients.abha_client import AbhaClient
+from eka_mcp_sdk.clients.eka_emr_client import EkaEMRClient
+from eka_mcp_sdk.utils.async_cache import AsyncTTLCache, scoped_key
+
+
+def test_get_or_compute_caches_value():
+    cache = AsyncTTLCache(maxsize=4, ttl=60)
+    fetch = AsyncMock(return_value={"oid": "p-1"})
+
+    async def run():
+        first = await cache.get_or_compute("p-1", lambda: fetch("p-1"))
+        second = await cache.get_or_compute("p-1", lambda: fetch("p-1"))
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    fetch.assert_awaited_once_with("p-1")
+    assert first == second == {"oid": "p-1"}
+
+
+def test_concurrent_misses_share_one_call():
+    cache = AsyncTTLCache(maxsize=4, ttl=60)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_compute("k", fetch) for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+
+
+def test_invalidate_and_expiry_force_refetch():
+    cache = AsyncTTLCache(maxsize=4, ttl=0)
+    fetch = AsyncMock(side_effect=["v1", "v2", "v3", "v4"])
+
+    async def run():
+        await cache.get_or_compute("k", fetch)
+        await cache.get_or_compute("k", fetch)  # ttl=0 -> already expired
+        cache.ttl = 60
+        cached = await cache.get_or_compute("k", fetch)
+        assert await cache.get_or_compute("k", fetch) == cached
+        cache.invalidate("k")
+        return await cache.get_or_compute("k", fetch)
+
+    assert asyncio.run(run()) == "v4"
+    assert fetch.await_count == 4
+
+
+def test_lru_eviction_and_errors_not_cached():
+    cache = AsyncTTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert len(cache) == 2
+
+    failing = AsyncMock(side_effect=RuntimeError("boom"))
+    with pytest.raises(RuntimeError):
+        asyncio.run(cache.get_or_compute("d", failing))
+    assert cache.get("d") is None
+
+
+def test_bump_tag_invalidates_every_scope_of_entity():
+    cache = AsyncTTLCache(maxsize=8, ttl=60)
+    cache.set(("token-a", "p-1"), "a", tag="p-1")
+    cache.set(("token-b", "p-1"), "b", tag="p-1")
+    cache.set(("token-a", "p-2"), "c", tag="p-2")
+
+    cache.bump("p-1")
+
+    assert cache.get(("token-a", "p-1")) is None
+    assert cache.get(("token-b", "p-1")) is None
+    assert cache.get(("token-a", "p-2")) == "c"
+
+    cache.bump()
+    assert cache.get(("token-a", "p-2")) is None
+
+
+def test_concurrent_misses_share_one_failure():
+    cache = AsyncTTLCache(maxsize=4, ttl=60)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def run():
+        return await asyncio.gather(
+            *(cache.get_or_compute("k", fetch) for _ in range(5)), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(calls) == 1
+    assert cache.get("k") is None
+
+
+def test_scoped_key_separates_callers_sharing_server_credentials():
+    workspace_a = EkaEMRClient(custom_headers={"x-eka-jwt-payload": '{"w-id": "a"}'})
+    workspace_b = EkaEMRClient(custom_headers={"x-eka-jwt-payload": '{"w-id": "b"}'})
+
+    assert scoped_key(workspace_a, "p-1") != scoped_key(workspace_b, "p-1")
+    assert scoped_key(workspace_a, "p-1") != scoped_key(AbhaClient(custom_headers=workspace_a._custom_headers), "p-1")
+    assert scoped_key(workspace_a, "p-1") == scoped_key(
+        EkaEMRClient(custom_headers={"x-eka-jwt-payload": '{"w-id": "a"}'}), "p-1"
+    )
+
+
+def test_bump_during_fetch_detaches_it_and_keeps_no_tag_state():
+    cache = AsyncTTLCache(maxsize=8, ttl=60)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        call_no = len(calls)
+        await asyncio.sleep(0.01)
+        return call_no
+
+    async def run():
+        stale = asyncio.ensure_future(cache.get_or_compute("k", fetch, tag="p-1"))
+        await asyncio.sleep(0)
+        cache.bump("p-1")
+        fresh = await cache.get_or_compute("k", fetch, tag="p-1")
+        return await stale, fresh
+
+    assert asyncio.run(run()) == (1, 2)
+    assert cache.get("k") == 2
+
+    cache.bump("p-1")
+    assert len(cache) == 0
+    assert vars(cache).keys() == {"maxsize", "ttl", "_data", "_inflight"}
@@ -0,0 +1,26 @@
+"""Unit tests for the auth models."""
+
+import pickle
+
+from eka_mcp_sdk.auth.models import EkaAPIError
+
+
+def test_eka_api_error_pickles_with_all_fields():
+    error = EkaAPIError("Patient not found", status_code=404, error_code="NOT_FOUND")
+
+    assert str(error) == "Patient not found"
+
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert (restored.message, restored.status_code, restored.error_code) == (
+        "Patient not found", 404, "NOT_FOUND"
+    )
+
+
+def test_eka_api_error_to_response_uses_standard_error_shape():
+    error = EkaAPIError("Invalid patient_id", status_code=400, error_code="INVALID_ID")
+
+    assert error.to_response() == {
+        "success": False,
+        "error": {"message": "Invalid patient_id", "status_code": 400, "error_code": "INVALID_ID"}
+    }
@@ -0,0 +1,64 @@
+"""Unit tests for request handling in BaseEkaClient."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from eka_mcp_sdk.auth.models import EkaAPIError
+from eka_mcp_sdk.clients import base_client
+
+
+def test_rate_limited_request_is_retried_with_backoff(make_client):
+    statuses = iter([429, 429, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), json={"ok": True})
+
+    async def run():
+        client = make_client(handler)
+        with patch.object(base_client.asyncio, "sleep") as sleep:
+            result = await client._make_request("GET", "/dr/v1/business/entities")
+        await client.close()
+        return result, [call.args[0] for call in sleep.call_args_list]
+
+    result, delays = asyncio.run(run())
+
+    assert result == {"ok": True}
+    assert delays == [0.1, 0.2]
+
+
+def test_rate_limit_gives_up_when_retry_after_exceeds_cap(make_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "30"}, json={"message": "slow down"})
+
+    async def run():
+        client = make_client(handler)
+        try:
+            await client._make_request("GET", "/dr/v1/business/entities")
+        finally:
+            await client.close()
+
+    with pytest.raises(EkaAPIError):
+        asyncio.run(run())
+    assert len(calls) == 1
+
+
+def test_large_response_is_decoded_off_the_event_loop(make_client):
+    def handler(request):
+        return httpx.Response(200, json={"appointments": [{"id": "a1"}]})
+
+    async def run(threshold):
+        client = make_client(handler)
+        with patch.object(base_client, "JSON_OFFLOAD_THRESHOLD", threshold), \
+                patch.object(base_client.asyncio, "to_thread", wraps=asyncio.to_thread) as to_thread:
+            result = await client._make_request("GET", "/dr/v1/appointment")
+        await client.close()
+        return result, to_thread.call_count
+
+    assert asyncio.run(run(1024 * 1024)) == ({"appointments": [{"id": "a1"}]}, 0)
+    assert asyncio.run(run(8)) == ({"appointments": [{"id": "a1"}]}, 1)
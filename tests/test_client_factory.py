@@ -0,0 +1,87 @@
+"""Unit tests for the shared client cache in ClientFactory."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from eka_mcp_sdk.clients.abha_client import AbhaClient
+from eka_mcp_sdk.clients.client_factory import ClientFactory
+from eka_mcp_sdk.clients.eka_emr_client import EkaEMRClient
+
+
+def test_get_client_reuses_client_per_caller():
+    ClientFactory._client_cache.clear()
+
+    first = ClientFactory.get_client("ekaemr", "token-a", {"b": "2", "a": "1"})
+    again = ClientFactory.get_client("EkaEMR", "token-a", {"a": "1", "b": "2"})
+    other_token = ClientFactory.get_client("ekaemr", "token-b", {"a": "1", "b": "2"})
+    other_headers = ClientFactory.get_client("ekaemr", "token-a", {"a": "9"})
+
+    assert first is again
+    assert first is not other_token
+    assert first is not other_headers
+    ClientFactory._client_cache.clear()
+
+
+def test_get_client_evicts_least_recently_used_and_close_all():
+    ClientFactory._client_cache.clear()
+
+    with patch.object(ClientFactory, "CLIENT_CACHE_SIZE", 2):
+        a = ClientFactory.get_client("ekaemr", "a")
+        ClientFactory.get_client("ekaemr", "b")
+        ClientFactory.get_client("ekaemr", "a")
+        ClientFactory.get_client("ekaemr", "c")
+
+        assert ClientFactory.get_client("ekaemr", "a") is a
+        assert len(ClientFactory._client_cache) == 2
+
+    clients = list(ClientFactory._client_cache.values())
+    for client in clients:
+        client.close = AsyncMock()
+
+    asyncio.run(ClientFactory.close_all())
+
+    assert len(ClientFactory._client_cache) == 0
+    for client in clients:
+        client.close.assert_awaited_once()
+
+
+def test_get_client_keys_on_client_class_override():
+    ClientFactory._client_cache.clear()
+
+    emr = ClientFactory.get_client("ekaemr", "token-a")
+    abha = ClientFactory.get_client("abha", "token-a", client_class=AbhaClient)
+
+    assert isinstance(abha, AbhaClient)
+    assert abha is not emr
+    assert ClientFactory.get_client("abha", "token-a", client_class=AbhaClient) is abha
+    ClientFactory._client_cache.clear()
+
+
+def test_clients_share_one_connection_pool():
+    ClientFactory._client_cache.clear()
+
+    a = ClientFactory.get_client("ekaemr", "token-a")
+    b = ClientFactory.get_client("ekaemr", "token-b")
+    abha = ClientFactory.get_client("abha", "token-a", client_class=AbhaClient)
+    pool = a._http_client
+
+    assert b._http_client is pool and abha._http_client is pool
+
+    asyncio.run(ClientFactory.close_all())
+
+    assert pool.is_closed
+    assert ClientFactory.get_client("ekaemr", "token-a")._http_client is not pool
+    asyncio.run(ClientFactory.close_all())
+
+
+def test_create_client_supports_clients_without_http_client_argument():
+    class LegacyWorkspaceClient(EkaEMRClient):
+        def __init__(self, access_token=None, custom_headers=None):
+            super().__init__(access_token, custom_headers)
+
+    client = ClientFactory.create_client("moolchand", "token-a", client_class=LegacyWorkspaceClient)
+
+    assert isinstance(client, LegacyWorkspaceClient)
+    assert client._http_client is ClientFactory.create_client("ekaemr", "token-a")._http_client
+    assert not client._owns_http_client
+    asyncio.run(ClientFactory.close_all())
@@ -0,0 +1,59 @@
+"""Unit tests for the concurrency helpers."""
+
+import asyncio
+
+import pytest
+
+from eka_mcp_sdk.auth.models import EkaAPIError
+from eka_mcp_sdk.utils.concurrency import bounded_gather, run_concurrently
+
+
+def test_run_concurrently_preserves_argument_order():
+    async def value(v, delay):
+        await asyncio.sleep(delay)
+        return v
+
+    results = asyncio.run(run_concurrently(value("a", 0.02), value("b", 0), value("c", 0.01)))
+
+    assert results == ["a", "b", "c"]
+
+
+def test_run_concurrently_cancels_siblings_and_reraises_unwrapped():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def failing():
+        raise EkaAPIError("Doctor not found", status_code=404)
+
+    with pytest.raises(EkaAPIError) as exc_info:
+        asyncio.run(run_concurrently(slow(), failing()))
+
+    assert exc_info.value.status_code == 404
+    assert cancelled == [True]
+
+
+def test_bounded_gather_limits_in_flight_calls():
+    in_flight = []
+    peak = []
+
+    async def call(v):
+        in_flight.append(v)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(v)
+        if v == 3:
+            raise RuntimeError("boom")
+        return v
+
+    results = asyncio.run(bounded_gather((call(v) for v in range(10)), limit=3, return_exceptions=True))
+
+    assert max(peak) == 3
+    assert results[:3] == [0, 1, 2]
+    assert isinstance(results[3], RuntimeError)
+    assert results[4:] == list(range(4, 10))
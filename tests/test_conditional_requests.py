@@ -0,0 +1,41 @@
+"""Unit tests for ETag revalidation of business entities."""
+
+import asyncio
+
+import httpx
+
+from eka_mcp_sdk.utils.async_cache import business_entities_cache, business_entities_validators
+
+ENTITIES = {
+    "business": {"business_id": "b-1", "name": "Clinic Co"},
+    "clinics": [],
+    "doctors": [],
+}
+
+
+def test_get_business_entities_revalidates_with_etag(make_client):
+    business_entities_cache.clear()
+    business_entities_validators.clear()
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json=ENTITIES, headers={"ETag": '"v1"'})
+
+    async def run():
+        client = make_client(handler)
+        first = await client.get_business_entities()
+        # Expire the short-lived entry so the next call revalidates
+        business_entities_cache.clear()
+        second = await client.get_business_entities()
+        await client.close()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert seen == [None, '"v1"']
+    assert second is first
+    business_entities_cache.clear()
+    business_entities_validators.clear()
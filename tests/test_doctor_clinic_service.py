@@ -0,0 +1,25 @@
+"""Unit tests for the DoctorClinicService business entities boundary."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from eka_mcp_sdk.clients.eka_emr_client import EkaEMRClient
+from eka_mcp_sdk.services.doctor_clinic_service import DoctorClinicService
+
+
+def test_get_business_entities_returns_a_copy_of_the_cached_result():
+    cached = {
+        "business": {"business_id": "b-1", "name": "Clinic Co"},
+        "clinics": [{"clinic_id": "c-1", "name": "Main", "doctors": ["d-1"]}],
+        "doctors": [{"doctor_id": "d-1", "name": "Dr A"}],
+    }
+    client = MagicMock(spec=EkaEMRClient)
+    client.get_business_entities = AsyncMock(return_value=cached)
+
+    result = asyncio.run(DoctorClinicService(client).get_business_entities())
+
+    assert result == cached
+    result["clinics"][0]["doctors"].append("d-2")
+    result["doctors"].clear()
+    assert cached["clinics"][0]["doctors"] == ["d-1"]
+    assert cached["doctors"] == [{"doctor_id": "d-1", "name": "Dr A"}]
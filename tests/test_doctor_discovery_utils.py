@@ -0,0 +1,27 @@
+"""Unit tests for the doctor discovery utilities."""
+
+from eka_mcp_sdk.utils.doctor_discovery_utils import find_doctor_clinics
+
+
+def test_find_doctor_clinics_uses_clinic_order_and_fresh_lists():
+    clinics = [
+        {"clinic_id": "c-1", "doctors": ["d-1", "d-2"]},
+        {"clinic_id": "c-2", "doctors": ["d-2", "d-2"]},
+        {"clinic_id": "c-3"},
+    ]
+
+    first = find_doctor_clinics(clinics, "d-2")
+    first.clear()
+
+    assert [c["clinic_id"] for c in find_doctor_clinics(clinics, "d-2")] == ["c-1", "c-2"]
+    assert [c["clinic_id"] for c in find_doctor_clinics(clinics, "d-1")] == ["c-1"]
+    assert find_doctor_clinics(clinics, "d-9") == []
+
+
+def test_find_doctor_clinics_sees_in_place_changes():
+    clinics = [{"clinic_id": "c-1", "doctors": ["d-1"]}]
+    assert [c["clinic_id"] for c in find_doctor_clinics(clinics, "d-1")] == ["c-1"]
+
+    clinics.append({"clinic_id": "c-2", "doctors": ["d-1"]})
+
+    assert [c["clinic_id"] for c in find_doctor_clinics(clinics, "d-1")] == ["c-1", "c-2"]
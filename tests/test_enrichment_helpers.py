@@ -0,0 +1,27 @@
+"""Unit tests for the enrichment helpers."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from eka_mcp_sdk.utils.async_cache import AsyncTTLCache
+from eka_mcp_sdk.utils.enrichment_helpers import prefetch_shared_data
+
+
+def test_prefetch_shared_data_fetches_each_unique_id_once():
+    client = MagicMock(access_token="token")
+
+    async def get_patient(patient_id):
+        if patient_id == "p-bad":
+            raise RuntimeError("not found")
+        return {"oid": patient_id}
+
+    fetch = AsyncMock(side_effect=get_patient)
+    cache = AsyncTTLCache(maxsize=8, ttl=60)
+
+    result = asyncio.run(prefetch_shared_data(
+        client, fetch, ["p-1", None, "p-2", "p-1", "p-bad", ""], cache
+    ))
+
+    assert result == {"p-1": {"oid": "p-1"}, "p-2": {"oid": "p-2"}}
+    assert sorted(call.args[0] for call in fetch.await_args_list) == ["p-1", "p-2", "p-bad"]
+
@@ -0,0 +1,80 @@
+"""Unit tests for the MCP tool helpers."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastmcp.tools.tool import default_serializer
+from pydantic import BaseModel
+
+from eka_mcp_sdk.auth.models import EkaAPIError
+from eka_mcp_sdk.config.settings import settings
+from eka_mcp_sdk.utils.fastmcp_helper import (
+    ctx_debug, ctx_info, normalize_id, normalize_mobile, tool_result_serializer
+)
+
+
+def test_normalize_id_strips_and_interns():
+    value = normalize_id("  1745914298311 ", "patient_id")
+
+    assert value == "1745914298311"
+    assert value is normalize_id("1745914298311", "patient_id")
+
+
+@pytest.mark.parametrize("value", ["", "   ", None, "../v1/patients", "a b", "x" * 65])
+def test_normalize_id_rejects_malformed_ids(value):
+    with pytest.raises(EkaAPIError) as exc_info:
+        normalize_id(value, "patient_id")
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.error_code == "INVALID_ID"
+
+
+def test_ctx_debug_is_lazy_below_debug_level():
+    ctx = MagicMock(debug=AsyncMock())
+    message = MagicMock(return_value="details")
+
+    with patch.object(settings, "log_level", "INFO"):
+        asyncio.run(ctx_debug(ctx, message))
+    message.assert_not_called()
+    ctx.debug.assert_not_awaited()
+
+    with patch.object(settings, "log_level", "debug"):
+        asyncio.run(ctx_debug(ctx, message))
+    ctx.debug.assert_awaited_once_with("details")
+
+
+def test_ctx_info_is_skipped_above_info_level():
+    ctx = MagicMock(info=AsyncMock())
+    message = MagicMock(return_value="progress")
+
+    with patch.object(settings, "log_level", "WARNING"):
+        asyncio.run(ctx_info(ctx, message))
+    message.assert_not_called()
+    ctx.info.assert_not_awaited()
+
+    with patch.object(settings, "log_level", "INFO"):
+        asyncio.run(ctx_info(ctx, message))
+    ctx.info.assert_awaited_once_with("progress")
+
+
+def test_normalize_mobile_accepts_e164_and_rejects_the_rest():
+    assert normalize_mobile(" +919876543210 ") == "+919876543210"
+    assert normalize_mobile("+14155550123") == "+14155550123"
+
+    for value in ["9876543210", "+91 98765 43210", "+91-9876543210", "", None]:
+        with pytest.raises(EkaAPIError) as exc_info:
+            normalize_mobile(value)
+        assert exc_info.value.error_code == "INVALID_MOBILE"
+
+
+def test_tool_result_serializer_matches_fastmcp_default():
+    class Slot(BaseModel):
+        start: str
+
+    for data in [
+        {"success": True, "data": {"appointments": [{"id": "a-1", "fee": 500.0}]}},
+        {1: "non-string key"},
+        {"slot": Slot(start="10:00")},
+    ]:
+        assert tool_result_serializer(data) == default_serializer(data)
@@ -0,0 +1,24 @@
+"""Unit tests for the tool parameter models."""
+
+import pytest
+from pydantic import ValidationError
+
+from eka_mcp_sdk.tools.models import AppointmentBookingRequest
+
+BOOKING = {"doctor_id": "d-1", "clinic_id": "c-1", "start_time": "10:00", "end_time": "10:30"}
+
+
+@pytest.mark.parametrize("value", ["2099-01-05", "2099-1-5"])
+def test_booking_date_accepts_future_dates(value):
+    assert AppointmentBookingRequest(date=value, **BOOKING).date == value
+
+
+@pytest.mark.parametrize("value, message", [
+    ("2000-01-01", "cannot be in the past"),
+    ("2099-02-30", "day is out of range"),
+    ("2099-0a-01", "Invalid date format"),
+    ("tomorrow", "Invalid date format"),
+])
+def test_booking_date_rejects_invalid_dates(value, message):
+    with pytest.raises(ValidationError, match=message):
+        AppointmentBookingRequest(date=value, **BOOKING)
@@ -0,0 +1,116 @@
+"""Unit tests for the PatientService comprehensive profile."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from eka_mcp_sdk.auth.models import EkaAPIError
+from eka_mcp_sdk.clients.eka_emr_client import EkaEMRClient
+from eka_mcp_sdk.services.patient_service import PatientService
+from eka_mcp_sdk.utils.async_cache import doctor_summary_cache
+
+
+def make_mock_client():
+    client = MagicMock(spec=EkaEMRClient)
+    client.access_token = "token"
+    client.get_patient_details = AsyncMock()
+    client.get_patient_appointments = AsyncMock()
+    client.get_doctor_profile = AsyncMock(return_value={})
+    client.get_clinic_details = AsyncMock(return_value={})
+    return client
+
+
+def test_comprehensive_profile_fetches_profile_and_appointments_together():
+    client = make_mock_client()
+    started = []
+
+    async def get_patient_details(patient_id):
+        started.append("profile")
+        await asyncio.sleep(0.01)
+        assert "appointments" in started
+        return {"oid": patient_id}
+
+    async def get_patient_appointments(patient_id, limit):
+        started.append("appointments")
+        return {"appointments": [{"appointment_id": "a-1", "status": "BK"}]}
+
+    client.get_patient_details.side_effect = get_patient_details
+    client.get_patient_appointments.side_effect = get_patient_appointments
+
+    result = asyncio.run(PatientService(client).get_comprehensive_patient_profile("p-1"))
+
+    assert result["patient_profile"] == {"oid": "p-1"}
+    assert [a["appointment_id"] for a in result["appointments"]] == ["a-1"]
+
+
+def test_comprehensive_profile_skips_appointments_and_propagates_errors():
+    client = make_mock_client()
+    client.get_patient_details.return_value = {"oid": "p-1"}
+
+    result = asyncio.run(PatientService(client).get_comprehensive_patient_profile(
+        "p-1", include_appointments=False
+    ))
+
+    assert result == {"patient_profile": {"oid": "p-1"}, "appointments": []}
+    client.get_patient_appointments.assert_not_awaited()
+
+    client.get_patient_details.side_effect = EkaAPIError("Patient not found", status_code=404)
+    client.get_patient_appointments.return_value = {"appointments": []}
+    with pytest.raises(EkaAPIError):
+        asyncio.run(PatientService(client).get_comprehensive_patient_profile("p-1"))
+
+
+def test_concurrent_reads_share_one_request_until_a_write():
+    client = make_mock_client()
+    client.update_patient = AsyncMock(return_value={"success": True})
+
+    async def get_patient_details(patient_id):
+        await asyncio.sleep(0.01)
+        return {"oid": patient_id}
+
+    client.get_patient_details.side_effect = get_patient_details
+
+    async def run():
+        service = PatientService(client)
+        first = asyncio.ensure_future(service.get_patient_details_basic("p-1"))
+        second = asyncio.ensure_future(service.get_patient_details_basic("p-1"))
+        await asyncio.sleep(0)
+        await service.update_patient("p-1", {"fln": "New Name"})
+        after_write = asyncio.ensure_future(service.get_patient_details_basic("p-1"))
+        return await asyncio.gather(first, second, after_write)
+
+    results = asyncio.run(run())
+
+    assert results == [{"oid": "p-1"}] * 3
+    assert client.get_patient_details.await_count == 2
+
+
+def test_enriched_rows_do_not_share_cached_summaries():
+    doctor_summary_cache.clear()
+    client = make_mock_client()
+    client.get_doctor_profile.return_value = {"name": "Dr. A", "contact": {"phone": "1"}}
+    appointments = {"appointments": [{"appointment_id": "a-1", "doctor_id": "d-1", "status": "BK"}]}
+
+    first = asyncio.run(PatientService(client)._enrich_patient_appointments(appointments))
+    first[0]["doctor_details"]["name"] = "edited"
+    first[0]["doctor_details"]["contact"]["phone"] = "edited"
+    second = asyncio.run(PatientService(client)._enrich_patient_appointments(appointments))
+
+    assert second[0]["doctor_details"]["name"] == "Dr. A"
+    assert second[0]["doctor_details"]["contact"] == {"phone": "1"}
+    client.get_doctor_profile.assert_awaited_once()
+    doctor_summary_cache.clear()
+
+
+def test_enriched_rows_get_their_own_status_info():
+    client = make_mock_client()
+    appointments = {"appointments": [
+        {"appointment_id": "a-1", "status": "BK"},
+        {"appointment_id": "a-2", "status": "BK"},
+    ]}
+
+    rows = asyncio.run(PatientService(client)._enrich_patient_appointments(appointments))
+    rows[0]["status_info"]["is_cancelled"] = True
+
+    assert rows[1]["status_info"]["is_cancelled"] is False
@@ -0,0 +1,22 @@
+"""Unit tests for per-request client resolution."""
+
+from unittest.mock import MagicMock, patch
+
+from eka_mcp_sdk.clients.client_factory import ClientFactory
+from eka_mcp_sdk.utils.tool_registration import _REQUEST_SCOPE_CTX
+from eka_mcp_sdk.utils.workspace_utils import get_request_client
+
+
+def test_get_request_client_resolves_once_per_tool_call():
+    with patch.object(ClientFactory, "get_client", MagicMock(side_effect=lambda *a: object())) as get_client:
+        token = _REQUEST_SCOPE_CTX.set({})
+        try:
+            first = get_request_client()
+            assert get_request_client() is first
+        finally:
+            _REQUEST_SCOPE_CTX.reset(token)
+        assert get_client.call_count == 1
+
+        # Outside a tool call every lookup resolves again
+        assert get_request_client() is not first
+        assert get_client.call_count == 2